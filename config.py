@@ -7,25 +7,74 @@ Version: 1.0
 """
 
 import os
+from typing import Final, List
+
+# python-dotenv is preferred when installed; the manual parser below is the fallback
+try:
+    from dotenv import load_dotenv
+    DOTENV_AVAILABLE = True
+except ImportError:
+    DOTENV_AVAILABLE = False
+
+# Survives importlib.reload() so the file is read at most once per process
+_ENV_LOADED = globals().get('_ENV_LOADED', False)
+
+def _load_env_once(env_file='.env'):
+    """Load environment variables from the .env file, only on the first call."""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
+    
+    if os.path.exists(env_file):
+        try:
+            if DOTENV_AVAILABLE:
+                load_dotenv(env_file, override=True, encoding='utf-8-sig')
+                return
+            
+            with open(env_file, 'r', encoding='utf-8-sig') as f:
+                lines = [line.strip() for line in f.read().splitlines()]
+            
+            pairs = (line.split('=', 1) for line in lines
+                     if line and not line.startswith('#') and '=' in line)
+            os.environ.update({key.strip(): value.strip() for key, value in pairs})
+        except Exception as e:
+            print(f"Warning: Could not read .env file: {e}")
+    else:
+        print("Warning: .env file not found")
 
 # Load environment variables from .env file
-env_file = '.env'
-if os.path.exists(env_file):
-    try:
-        with open(env_file, 'r', encoding='utf-8-sig') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        os.environ[key.strip()] = value.strip()
-    except Exception as e:
-        print(f"Warning: Could not read .env file: {e}")
-else:
-    print("Warning: .env file not found")
+_load_env_once()
+
+# Trading parameters
+POSITION_SIZE: Final[float] = 100  # $100 per trade
+STOP_LOSS_PCT: Final[float] = 0.03  # 3% stop loss
+TAKE_PROFIT_PCT: Final[float] = 0.08  # 8% take profit
+
+# VWAP Reversion Strategy parameters
+VWAP_BUY_THRESHOLD: Final[float] = 0.99    # Buy when price < VWAP × 0.99
+VWAP_SELL_THRESHOLD: Final[float] = 1.01   # Sell when price > VWAP × 1.01
+RSI_PERIOD: Final[int] = 14                # RSI calculation period
+RSI_OVERBOUGHT: Final[float] = 70          # RSI overbought level
+VWAP_SAFETY_THRESHOLD: Final[float] = 0.95 # Safety: don't buy if price < VWAP × 0.95
+
+# Default symbols to trade
+DEFAULT_SYMBOLS: Final[List[str]] = ["AAPL", "NVDA", "TSLA", "AMZN", "META"]
+
+# Timeframe for data (VWAP works best with shorter timeframes)
+TIMEFRAME: Final[str] = "5Min"  # 5-minute bars for intraday VWAP strategy
+
+# Database
+DATABASE_PATH: Final[str] = "trades.db"
 
 class Config:
-    """Configuration class for the trading bot."""
+    """
+    Configuration class for the trading bot.
+    
+    The trading/strategy constants are also exported at module level so hot
+    loops can import them directly (a single global lookup instead of an
+    attribute lookup on the class).
+    """
     
     # Alpaca API credentials
     ALPACA_API_KEY = os.getenv('ALPACA_API_KEY')
@@ -33,25 +82,25 @@ class Config:
     BASE_URL = os.getenv('BASE_URL', 'https://paper-api.alpaca.markets')
     
     # Trading parameters
-    POSITION_SIZE = 100  # $100 per trade
-    STOP_LOSS_PCT = 0.03  # 3% stop loss
-    TAKE_PROFIT_PCT = 0.08  # 8% take profit
+    POSITION_SIZE = POSITION_SIZE
+    STOP_LOSS_PCT = STOP_LOSS_PCT
+    TAKE_PROFIT_PCT = TAKE_PROFIT_PCT
     
     # VWAP Reversion Strategy parameters
-    VWAP_BUY_THRESHOLD = 0.99    # Buy when price < VWAP × 0.99
-    VWAP_SELL_THRESHOLD = 1.01   # Sell when price > VWAP × 1.01
-    RSI_PERIOD = 14              # RSI calculation period
-    RSI_OVERBOUGHT = 70          # RSI overbought level
-    VWAP_SAFETY_THRESHOLD = 0.95 # Safety: don't buy if price < VWAP × 0.95
+    VWAP_BUY_THRESHOLD = VWAP_BUY_THRESHOLD
+    VWAP_SELL_THRESHOLD = VWAP_SELL_THRESHOLD
+    RSI_PERIOD = RSI_PERIOD
+    RSI_OVERBOUGHT = RSI_OVERBOUGHT
+    VWAP_SAFETY_THRESHOLD = VWAP_SAFETY_THRESHOLD
     
     # Default symbols to trade
-    DEFAULT_SYMBOLS = ["AAPL", "NVDA", "TSLA", "AMZN", "META"]
+    DEFAULT_SYMBOLS = DEFAULT_SYMBOLS
     
-    # Timeframe for data (VWAP works best with shorter timeframes)
-    TIMEFRAME = "5Min"  # 5-minute bars for intraday VWAP strategy
+    # Timeframe for data
+    TIMEFRAME = TIMEFRAME
     
     # Database
-    DATABASE_PATH = "trades.db"
+    DATABASE_PATH = DATABASE_PATH
     
     @classmethod
     def validate_config(cls):
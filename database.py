@@ -3,28 +3,152 @@ Database module for Hybrid-Safe trading bot.
 Handles SQLite database operations for trade logging.
 """
 
+import os
+import queue
+import re
 import sqlite3
-import pandas as pd
-from datetime import datetime
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from urllib.request import pathname2url
 from config import Config
 
+# Number of read-only connections kept open for history/stats queries
+READ_POOL_SIZE = 2
+
+# Seconds a cached stats/balance read stays valid (writes from this handler
+# invalidate it immediately; the TTL bounds staleness from other processes)
+READ_CACHE_TTL = 5.0
+
+# The one text format of every stored timestamp: local time, always with
+# microseconds, so rows written by any path sort and compare correctly as text
+TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+
+# Bound once: log_trade/log_account_balance stamp every row with it
+_now = datetime.now
+
+# Strings handed to the batch paths must already be in TIMESTAMP_FORMAT
+_is_timestamp = re.compile(r'\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{6}').fullmatch
+
+def format_timestamp(when=None):
+    """
+    Format a time the way trade and balance timestamps are stored.
+    
+    Args:
+        when (datetime): Time to format (defaults to now); timezone-aware times
+            (e.g. UTC pandas Timestamps) are converted to local time first, and
+            strings must already be in TIMESTAMP_FORMAT
+        
+    Returns:
+        str: Timestamp in TIMESTAMP_FORMAT
+        
+    Raises:
+        ValueError: If a string timestamp is not in TIMESTAMP_FORMAT
+    """
+    if when is None:
+        # Same text as strftime(TIMESTAMP_FORMAT) at about half the cost
+        return _now().isoformat(timespec='microseconds')
+    if isinstance(when, str):
+        if not _is_timestamp(when):
+            raise ValueError(f"Timestamp not in {TIMESTAMP_FORMAT} format: {when!r}")
+        return when
+    if when.tzinfo is not None:
+        # Unbound call so pandas Timestamps convert to local time too
+        when = datetime.astimezone(when).replace(tzinfo=None)
+    return when.isoformat(timespec='microseconds')
+
+# Insert statements (timestamp first, formatted with format_timestamp)
+_INSERT_TRADE_SQL = '''
+    INSERT INTO trades 
+    (timestamp, symbol, side, price, qty, status, order_id, stop_loss, take_profit, reason)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_BALANCE_SQL = '''
+    INSERT INTO account_balance 
+    (timestamp, balance, equity, buying_power)
+    VALUES (?, ?, ?, ?)
+'''
+
+def to_dataframe(rows, columns=None):
+    """
+    Convert query rows into a DataFrame.
+    
+    Args:
+        rows (list): Rows returned by one of the TradeDatabase read methods
+        columns (list): Column names (taken from the rows when omitted)
+        
+    Returns:
+        pd.DataFrame: Rows as a DataFrame
+    """
+    import pandas as pd
+    
+    if columns is None:
+        columns = list(rows[0].keys()) if rows else None
+    return pd.DataFrame.from_records([tuple(row) for row in rows], columns=columns)
+
+# Column order of the account_balance table, used when building DataFrames
+_BALANCE_COLUMNS = ['id', 'timestamp', 'balance', 'equity', 'buying_power']
+
 class TradeDatabase:
     """SQLite database handler for trade logging."""
     
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, read_pool_size=READ_POOL_SIZE):
         """
-        Initialize the database connection.
+        Initialize the database connections.
         
         Args:
             db_path (str): Path to SQLite database file
+            read_pool_size (int): Number of read-only connections to keep open
         """
         self.db_path = db_path or Config.DATABASE_PATH
+        self._read_pool = queue.Queue()
+        
+        # Single long-lived writer in autocommit mode; the bot and GUI
+        # threads share it, so writes are serialized through a lock
+        self._write_conn = sqlite3.connect(self.db_path, isolation_level=None,
+                                    check_same_thread=False, timeout=5.0,
+                                    cached_statements=256)
+        self._write_conn.executescript('''
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-20000;
+            PRAGMA busy_timeout=5000;
+            PRAGMA mmap_size=268435456;
+        ''')
+        self._lock = threading.RLock()
+        
+        # Per-thread list collecting log_trade rows inside buffer_trades
+        self._local = threading.local()
+        
+        # Dashboard read cache, invalidated by bumping the version on every write
+        self._cache_version = 0
+        self._read_cache = {}
+        
+        # Reused by every log call so inserts don't allocate a new cursor
+        self._cursor = self._write_conn.cursor()
+        
         self.init_database()
+        
+        # Read-only connections so history/stats queries never wait on the writer
+        ro_uri = f"file:{pathname2url(os.path.abspath(self.db_path))}?mode=ro"
+        for _ in range(read_pool_size):
+            conn = sqlite3.connect(ro_uri, uri=True, isolation_level=None,
+                                   check_same_thread=False, timeout=5.0,
+                                   cached_statements=256)
+            conn.executescript('''
+                PRAGMA busy_timeout=5000;
+                PRAGMA mmap_size=268435456;
+            ''')
+            conn.row_factory = sqlite3.Row
+            self._read_pool.put(conn)
     
     def init_database(self):
         """Initialize the database and create tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
+        with self.transaction():
+            cursor = self._write_conn.cursor()
             
             # Create trades table
             cursor.execute('''
@@ -43,6 +167,16 @@ class TradeDatabase:
                 )
             ''')
             
+            # Indexes for per-symbol history and the time-windowed stats
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_trades_symbol_ts 
+                ON trades(symbol, timestamp DESC)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_trades_ts 
+                ON trades(timestamp)
+            ''')
+            
             # Create account_balance table for tracking balance over time
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS account_balance (
@@ -54,7 +188,13 @@ class TradeDatabase:
                 )
             ''')
             
-            conn.commit()
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_account_balance_ts 
+                ON account_balance(timestamp)
+            ''')
+            
+            # Refresh planner statistics so the indexes above get used
+            cursor.execute('ANALYZE')
     
     def log_trade(self, symbol, side, price, qty, status, order_id=None, 
                   stop_loss=None, take_profit=None, reason=None):
@@ -72,17 +212,64 @@ class TradeDatabase:
             take_profit (float): Take profit price
             reason (str): Reason for the trade
         """
-        timestamp = datetime.now().isoformat()
+        row = (format_timestamp(), symbol, side, price, qty, status,
+               order_id, stop_loss, take_profit, reason)
+        buffered = getattr(self._local, 'trades', None)
+        if buffered is not None:
+            buffered.append(row)
+            return
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO trades 
-                (timestamp, symbol, side, price, qty, status, order_id, stop_loss, take_profit, reason)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (timestamp, symbol, side, price, qty, status, order_id, 
-                  stop_loss, take_profit, reason))
-            conn.commit()
+        with self._lock:
+            self._cursor.execute(_INSERT_TRADE_SQL, row)
+            self._cache_version += 1
+    
+    def log_trades_many(self, trades):
+        """
+        Log several trades in a single transaction.
+        
+        Args:
+            trades (list): Tuples of (timestamp, symbol, side, price, qty, status,
+                order_id, stop_loss, take_profit, reason); timestamps are
+                normalised with format_timestamp
+        """
+        rows = [(format_timestamp(trade[0]), *trade[1:]) for trade in trades]
+        with self.transaction():
+            self._cursor.executemany(_INSERT_TRADE_SQL, rows)
+            self._cache_version += 1
+    
+    def log_trades_df(self, df):
+        """
+        Bulk-log trades from a DataFrame (e.g. a backtest replay) in one transaction.
+        
+        Args:
+            df (pd.DataFrame): Trades with 'symbol', 'side', 'price', 'qty' and
+                'status' columns, plus optional 'timestamp', 'order_id',
+                'stop_loss', 'take_profit' and 'reason' columns
+        """
+        import pandas as pd
+        
+        if df.empty:
+            return
+        
+        columns = ['symbol', 'side', 'price', 'qty', 'status',
+                   'order_id', 'stop_loss', 'take_profit', 'reason']
+        values = df.reindex(columns=columns).astype(object)
+        values = values.where(values.notna(), None)
+        
+        # Stored timestamps use the same format as log_trade
+        if 'timestamp' in df.columns:
+            timestamps = df['timestamp']
+            # Naive datetimes format in one vectorized pass; aware ones are
+            # converted to local time per row by format_timestamp
+            if (pd.api.types.is_datetime64_any_dtype(timestamps)
+                    and timestamps.dt.tz is None):
+                timestamps = timestamps.dt.strftime(TIMESTAMP_FORMAT)
+            timestamps = timestamps.tolist()
+        else:
+            timestamps = [format_timestamp()] * len(df)
+        
+        rows = zip(timestamps, *(values[col].tolist() for col in columns))
+        self.log_trades_many(rows)
     
     def log_account_balance(self, balance, equity, buying_power):
         """
@@ -93,72 +280,174 @@ class TradeDatabase:
             equity (float): Account equity
             buying_power (float): Available buying power
         """
-        timestamp = datetime.now().isoformat()
+        with self._lock:
+            self._cursor.execute(_INSERT_BALANCE_SQL, (format_timestamp(), balance, equity,
+                                                       buying_power))
+            self._cache_version += 1
+    
+    def log_balances_many(self, balances):
+        """
+        Log several account balance records in a single transaction.
         
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO account_balance 
-                (timestamp, balance, equity, buying_power)
-                VALUES (?, ?, ?, ?)
-            ''', (timestamp, balance, equity, buying_power))
-            conn.commit()
+        Args:
+            balances (list): Tuples of (timestamp, balance, equity, buying_power);
+                timestamps are normalised with format_timestamp
+        """
+        rows = [(format_timestamp(balance[0]), *balance[1:]) for balance in balances]
+        with self.transaction():
+            self._cursor.executemany(_INSERT_BALANCE_SQL, rows)
+            self._cache_version += 1
+    
+    @contextmanager
+    def buffer_trades(self):
+        """
+        Collect log_trade calls made by this thread inside the block and write
+        them with one log_trades_many call when it exits.
+        
+        Unlike transaction(), no database lock is held while the block runs,
+        so slow work inside it (such as order round-trips) never blocks other
+        writers. The rows are written even if the block raises, so trades the
+        broker already accepted are not lost. Nested blocks join the outer one.
+        """
+        if getattr(self._local, 'trades', None) is not None:
+            yield
+            return
+        
+        self._local.trades = trades = []
+        try:
+            yield
+        finally:
+            self._local.trades = None
+            if trades:
+                self.log_trades_many(trades)
     
-    def get_recent_trades(self, limit=10):
+    @contextmanager
+    def transaction(self):
+        """
+        Group all writes made inside the block into one transaction.
+        
+        The transaction is started with BEGIN IMMEDIATE so the write lock is
+        taken up front instead of being upgraded mid-transaction (which can fail
+        with SQLITE_BUSY). It is committed once when the block exits and rolled
+        back if it raises. Nested blocks join the outer transaction.
+        """
+        with self._lock:
+            if self._write_conn.in_transaction:
+                yield self._write_conn
+                return
+            
+            self._write_conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._write_conn
+            except BaseException:
+                self._write_conn.execute('ROLLBACK')
+                raise
+            self._write_conn.execute('COMMIT')
+            self._cache_version += 1
+    
+    def _cached_read(self, key, loader):
+        """
+        Return a cached read result, reloading it after a write or once the TTL expires.
+        
+        Args:
+            key (tuple): Cache key identifying the query and its arguments
+            loader (callable): Function that runs the query
+        """
+        entry = self._read_cache.get(key)
+        now = time.monotonic()
+        if entry is not None:
+            version, expires, value = entry
+            if version == self._cache_version and now < expires:
+                return value
+        
+        version = self._cache_version
+        value = loader()
+        self._read_cache[key] = (version, now + READ_CACHE_TTL, value)
+        return value
+    
+    @contextmanager
+    def _read_conn(self):
+        """Borrow a read-only connection from the pool for the duration of the block."""
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+    
+    def get_recent_trades(self, limit=10, as_df=False):
         """
         Get recent trades from the database.
         
         Args:
             limit (int): Number of recent trades to retrieve
+            as_df (bool): Return a pandas DataFrame instead of rows
             
         Returns:
-            pd.DataFrame: Recent trades
+            list[sqlite3.Row] | pd.DataFrame: Recent trades
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read_conn() as conn:
             query = '''
                 SELECT * FROM trades 
-                ORDER BY timestamp DESC 
+                ORDER BY timestamp DESC, id DESC 
                 LIMIT ?
             '''
-            return pd.read_sql_query(query, conn, params=(limit,))
+            cursor = conn.execute(query, (limit,))
+            rows = cursor.fetchall()
+            if as_df:
+                return to_dataframe(rows, [col[0] for col in cursor.description])
+            return rows
     
-    def get_trades_by_symbol(self, symbol, limit=50):
+    def get_trades_by_symbol(self, symbol, limit=50, as_df=False):
         """
         Get trades for a specific symbol.
         
         Args:
             symbol (str): Trading symbol
             limit (int): Number of trades to retrieve
+            as_df (bool): Return a pandas DataFrame instead of rows
             
         Returns:
-            pd.DataFrame: Trades for the symbol
+            list[sqlite3.Row] | pd.DataFrame: Trades for the symbol
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._read_conn() as conn:
             query = '''
                 SELECT * FROM trades 
                 WHERE symbol = ? 
-                ORDER BY timestamp DESC 
+                ORDER BY timestamp DESC, id DESC 
                 LIMIT ?
             '''
-            return pd.read_sql_query(query, conn, params=(symbol, limit))
+            cursor = conn.execute(query, (symbol, limit))
+            rows = cursor.fetchall()
+            if as_df:
+                return to_dataframe(rows, [col[0] for col in cursor.description])
+            return rows
     
-    def get_account_balance_history(self, limit=24):
+    def get_account_balance_history(self, limit=24, as_df=False):
         """
         Get account balance history.
         
         Args:
             limit (int): Number of balance records to retrieve
+            as_df (bool): Return a pandas DataFrame instead of rows
             
         Returns:
-            pd.DataFrame: Account balance history
+            list[sqlite3.Row] | pd.DataFrame: Account balance history
         """
-        with sqlite3.connect(self.db_path) as conn:
+        rows = self._cached_read(('balance_history', limit),
+                                 lambda: self._load_balance_history(limit))
+        if as_df:
+            return to_dataframe(rows, _BALANCE_COLUMNS)
+        return list(rows)
+    
+    def _load_balance_history(self, limit):
+        """Query the most recent account balance records."""
+        with self._read_conn() as conn:
             query = '''
                 SELECT * FROM account_balance 
-                ORDER BY timestamp DESC 
+                ORDER BY timestamp DESC, id DESC 
                 LIMIT ?
             '''
-            return pd.read_sql_query(query, conn, params=(limit,))
+            return conn.execute(query, (limit,)).fetchall()
     
     def get_trade_stats(self):
         """
@@ -167,35 +456,62 @@ class TradeDatabase:
         Returns:
             dict: Trade statistics
         """
-        with sqlite3.connect(self.db_path) as conn:
+        # Copy so callers can't mutate the cached result
+        stats = self._cached_read(('trade_stats',), self._load_trade_stats)
+        return {**stats, 'symbol_counts': dict(stats['symbol_counts'])}
+    
+    def _load_trade_stats(self):
+        """Run the trade statistics queries."""
+        with self._read_conn() as conn:
             cursor = conn.cursor()
             
-            # Total trades
-            cursor.execute('SELECT COUNT(*) FROM trades')
-            total_trades = cursor.fetchone()[0]
+            # Cutoff in the same local ISO format the timestamps are stored in
+            cutoff = format_timestamp(_now() - timedelta(days=1))
             
-            # Buy vs Sell trades
-            cursor.execute('SELECT side, COUNT(*) FROM trades GROUP BY side')
-            side_counts = dict(cursor.fetchall())
-            
-            # Trades by symbol
-            cursor.execute('SELECT symbol, COUNT(*) FROM trades GROUP BY symbol ORDER BY COUNT(*) DESC')
-            symbol_counts = dict(cursor.fetchall())
-            
-            # Recent trades (last 24 hours)
-            cursor.execute('''
-                SELECT COUNT(*) FROM trades 
-                WHERE timestamp > datetime('now', '-1 day')
-            ''')
-            recent_trades = cursor.fetchone()[0]
+            # Read both queries from one snapshot
+            cursor.execute('BEGIN')
+            try:
+                # Totals, buy/sell split and last-24h count in a single scan
+                cursor.execute('''
+                    SELECT COUNT(*),
+                           COALESCE(SUM(side = 'buy'), 0),
+                           COALESCE(SUM(side = 'sell'), 0),
+                           COALESCE(SUM(timestamp > ?), 0)
+                    FROM trades
+                ''', (cutoff,))
+                total_trades, buy_trades, sell_trades, recent_trades = cursor.fetchone()
+                
+                # Trades by symbol
+                cursor.execute('SELECT symbol, COUNT(*) FROM trades GROUP BY symbol ORDER BY COUNT(*) DESC')
+                symbol_counts = dict(cursor.fetchall())
+            finally:
+                cursor.execute('COMMIT')
             
             return {
                 'total_trades': total_trades,
-                'buy_trades': side_counts.get('buy', 0),
-                'sell_trades': side_counts.get('sell', 0),
+                'buy_trades': buy_trades,
+                'sell_trades': sell_trades,
                 'symbol_counts': symbol_counts,
                 'recent_trades_24h': recent_trades
             }
-
-
-
+    
+    def close(self):
+        """Close the writer and all pooled read connections."""
+        read_pool = getattr(self, '_read_pool', None)
+        while read_pool is not None and not read_pool.empty():
+            try:
+                read_pool.get_nowait().close()
+            except Exception:
+                pass
+        
+        conn = getattr(self, '_write_conn', None)
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+            self._write_conn = None
+    
+    def __del__(self):
+        """Close the connections when the handler is garbage collected."""
+        self.close()
@@ -8,21 +8,27 @@ Version: 1.1
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
+import tkinter.font as tkfont
 import threading
 import time
+import queue
+import collections
+from concurrent.futures import ThreadPoolExecutor
 import csv
 import json
 import os
-from datetime import datetime
+import re
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 
 # Import bot components
 from config import Config
 from trader import AlpacaTrader
 from strategy import VWAPReversionStrategy
-from indicators import calculate_all_indicators, get_latest_signals, validate_data_quality
+from indicators import calculate_latest_signals_batch, validate_data_quality
 from database import TradeDatabase
-from market_hours import get_market_status
+from market_hours import get_market_status, get_next_market_open, get_next_transition, get_market_hours
 from profile_manager import ProfileManager
 
 # Import PIL for image handling
@@ -32,88 +38,432 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+LOGO_PATH = "vwap-trader-logo.png"
+
+# Bytes read per block when importing symbol CSVs
+CSV_CHUNK_SIZE = 1 << 20
+
+# Market status only changes at minute boundaries, so it is reused for this many seconds
+MARKET_STATUS_TTL = 30
+
+# The status display re-checks just after each market transition, and at least hourly
+MARKET_TRANSITION_SLACK_MS = 1000
+MARKET_STATUS_MAX_DELAY_MS = 60 * 60 * 1000
+
+# Seconds between account refreshes in the bot loop, while open / closed
+ACCOUNT_REFRESH_OPEN = 60
+ACCOUNT_REFRESH_CLOSED = 300
+
+# Bar length per Config.TIMEFRAME; the bot analyzes once per closed bar, this
+# many seconds after the close so the bar is available from the data API
+BAR_SECONDS = {'1Min': 60, '5Min': 300, '15Min': 900, '1Hour': 3600, '1Day': 86400}
+BAR_CLOSE_SLACK = 5
+
+# Upper bound on concurrent historical-data requests per refresh
+MAX_FETCH_WORKERS = 16
+# Quiet period before a burst of Refresh clicks / listbox refreshes is acted on
+REFRESH_DEBOUNCE_MS = 250
+LISTBOX_DEBOUNCE_MS = 50
+# Symbols per multi-symbol bars request (keeps the query string a sane length)
+SYMBOLS_PER_BARS_REQUEST = 50
+
+# How often (ms) widget updates queued by the bot thread are applied
+UI_QUEUE_POLL_MS = 50
+
+# Log widget batching: flush interval (ms) and number of lines kept
+LOG_FLUSH_MS = 100
+MAX_LOG_LINES = 5000
+
+@lru_cache(maxsize=4)
+def _cached_market_status(bucket):
+    """
+    Get market status, memoized per time bucket.
+    
+    Callers pass int(time.time() // MARKET_STATUS_TTL), so every call within
+    the same MARKET_STATUS_TTL-second window shares one lookup.
+    """
+    return get_market_status()
+
+@lru_cache(maxsize=None)
+def _logo_source():
+    """Decode the logo image once per process, or return None if it isn't available."""
+    if not PIL_AVAILABLE or not os.path.exists(LOGO_PATH):
+        return None
+    
+    try:
+        with Image.open(LOGO_PATH) as logo:
+            return logo.convert("RGBA")
+    except Exception as e:
+        print(f"Could not load logo: {e}")
+        return None
+
+@lru_cache(maxsize=None)
+def _logo_image(size):
+    """
+    Get the logo resized to a square, memoized per size.
+    
+    PIL images are cached rather than PhotoImages, since a PhotoImage
+    belongs to one Tk interpreter.
+    
+    Args:
+        size (int): Edge length in pixels
+        
+    Returns:
+        Image.Image: Resized logo, or None if it isn't available
+    """
+    logo = _logo_source()
+    if logo is None:
+        return None
+    return logo.resize((size, size), Image.Resampling.LANCZOS)
+
+# Stripped from both ends of a CSV cell in a single pass
+_CELL_JUNK = ' \t\r\n\f\v"\''
+
+def _iter_first_cells(f, chunk_size=CSV_CHUNK_SIZE):
+    """
+    Yield the uppercased first CSV column of every line of a binary file.
+    
+    The file is read in fixed-size blocks, so memory stays bounded for huge
+    symbol universes. Tickers are ASCII: each block is decoded (dropping
+    anything else, including a UTF-8 BOM) and uppercased in one call.
+    
+    Args:
+        f: File opened in binary mode
+        chunk_size (int): Bytes per read
+        
+    Yields:
+        str: First cell of each line with surrounding whitespace and quotes removed
+    """
+    tail = ""
+    for block in iter(lambda: f.read(chunk_size), b""):
+        lines = (tail + block.decode('ascii', 'ignore').upper()).split('\n')
+        tail = lines.pop()  # May be an incomplete line
+        for line in lines:
+            yield line.split(',', 1)[0].strip(_CELL_JUNK)
+    if tail:
+        yield tail.split(',', 1)[0].strip(_CELL_JUNK)
+
+def _next_open_key(current_time):
+    """Cache key for the next market open: it only changes at midnight and at the close."""
+    return current_time.date(), current_time.time() >= get_market_hours().market_close
+
+@lru_cache(maxsize=2)
+def _cached_next_open(day, after_close):
+    """Get the next market open time, memoized per (day, after_close) key."""
+    return get_next_market_open()
+
+# Splits a symbols string on commas and/or whitespace in one pass
+_SPLIT = re.compile(r"[,\s]+").split
+
+# How each strategy decision is shown in the analysis log
+_DECISION_LABELS = {'buy': "BUY signal", 'sell': "SELL signal", 'hold': "HOLD"}
+
+# Dashboard account rows: (caption, value shown before connecting)
+_ACCOUNT_ROWS = (
+    ("Account Value:", "Not connected"),
+    ("Buying Power:", "Not connected"),
+    ("Cash:", "Not connected"),
+    ("Open Positions:", "0 positions"),
+)
+
+# What a numeric setting entry may hold while being typed (so "", "-" and "1." pass)
+_PARTIAL_FLOAT = re.compile(r'-?\d*\.?\d*').fullmatch
+_PARTIAL_INT = re.compile(r'\d*').fullmatch
+
+# Accepted ticker shape: a letter followed by up to nine letters, digits, '.', '/' or '-'
+# (so share classes like "BRK.B" and pairs like "BTC/USD" pass)
+_SYMBOL_RE = re.compile(r'^[A-Z][A-Z0-9./\-]{0,9}$')
+
+# Custom button styles: name -> background colour
+_STYLES = {'Accent': '#0b8fce', 'Success': '#00aa00', 'Danger': '#aa0000'}
+
+def _ensure_styles(style, font):
+    """
+    Configure the custom button styles once per Tk interpreter.
+    
+    Args:
+        style (ttk.Style): Style object of the current root window
+        font (tkfont.Font): Font for the styled buttons
+    """
+    if getattr(_ensure_styles, 'interp', None) is style.tk:
+        return
+    try:
+        for name, bg in _STYLES.items():
+            style.configure(f'{name}.TButton', background=bg, foreground='white',
+                            font=font)
+        _ensure_styles.interp = style.tk
+    except tk.TclError as e:
+        # Use default styles if custom styles fail
+        print(f"Warning: Could not configure custom button styles: {e}")
+
 class VWAPReversionGUI:
     """
     GUI for VWAP Reversion Trading Bot with professional styling and full functionality.
     """
     
+    __slots__ = (
+        # Window, widgets and images
+        "root", "main_frame", "notebook", "dashboard_frame", "settings_frame",
+        "symbols_frame", "profiles_frame", "logs_frame", "logs_text", "symbols_listbox",
+        "profiles_listbox", "connect_btn", "start_btn", "stop_btn", "refresh_btn",
+        "status_label", "market_status_label", "next_open_label", "last_update_label",
+        "bot_status_label", "logo_photo",
+        # Tk variables
+        "symbols", "position_size", "stop_loss_pct", "take_profit_pct",
+        "vwap_buy_threshold", "vwap_sell_threshold", "rsi_overbought", "rsi_period",
+        "refresh_interval", "auto_refresh", "account_details_var",
+        "market_status_var", "next_open_var", "status_var",
+        "last_update_var", "bot_status_var", "current_profile_var", "footer_status_var",
+        "_symbols_listvar", "_profiles_listvar",
+        # Bot components and state
+        "trader", "strategy", "database", "profile_manager", "bot_running",
+        "data_refresh_running", "_tab_builders", "_stop_evt", "_io_pool", "_fetch_pool", "_refresh_future",
+        # Caches, buffers and trace bookkeeping
+        "_ui_queue", "_log_buf", "_log_lock", "_ts_cache", "_write_traces",
+        "_numeric_settings", "_settings_dirty", "_symbols_list", "_symbol_set",
+        "_symbols_text", "_profile_fields", "_market_after_id", "_acct_cache",
+        "_pending_sets", "_flush_scheduled", "_fonts", "_debounced", "_last_acct_ts",
+    )
+    
+    # Default setting strings, used for new windows and for keys missing from a profile
+    _DEFAULTS = {
+        "position_size": str(Config.POSITION_SIZE),
+        "stop_loss_pct": str(Config.STOP_LOSS_PCT * 100),
+        "take_profit_pct": str(Config.TAKE_PROFIT_PCT * 100),
+        "vwap_buy_threshold": str(Config.VWAP_BUY_THRESHOLD),
+        "vwap_sell_threshold": str(Config.VWAP_SELL_THRESHOLD),
+        "rsi_overbought": str(Config.RSI_OVERBOUGHT),
+        "rsi_period": str(Config.RSI_PERIOD),
+        "refresh_interval": "5",
+        "auto_refresh": True,
+    }
+    
+    # Settings stored in a profile; each key is also the name of its Tk variable
+    _PROFILE_FIELDS = ("symbols", "position_size", "stop_loss_pct", "take_profit_pct",
+                       "vwap_buy_threshold", "vwap_sell_threshold", "rsi_overbought",
+                       "rsi_period", "refresh_interval", "auto_refresh")
+    
     def __init__(self):
         """Initialize the GUI."""
         self.root = tk.Tk()
+        self._fonts = {}  # (family, size, weight) -> tkfont.Font, see _font
+        self._debounced = {}  # key -> pending after() id, see _debounce
+        
         self.setup_window()
         
+        # Widget updates queued from background threads
+        self._ui_queue = queue.Queue()
+        
+        # Pending log entries, flushed to the logs widget by _flush_logs
+        self._log_buf = collections.deque(maxlen=MAX_LOG_LINES)
+        self._log_lock = threading.Lock()
+        self._ts_cache = (0, "")  # (epoch second, formatted HH:MM:SS)
+        
         # Bot components
         self.trader = AlpacaTrader()
         self.strategy = VWAPReversionStrategy()
         self.database = TradeDatabase()
         self.profile_manager = ProfileManager()
         
+        # Runs the button-triggered Alpaca calls so they don't block the Tk mainloop
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._refresh_future = None
+        # Bar fetches for every analysis pass; threads start on demand and are reused
+        self._fetch_pool = ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS)
+        
         # GUI state
         self.bot_running = False
+        self._stop_evt = threading.Event()
         self.data_refresh_running = False
-        self.auto_refresh = tk.BooleanVar(value=True)
-        self.refresh_interval = tk.StringVar(value="5")
+        self.auto_refresh = tk.BooleanVar(value=self._DEFAULTS["auto_refresh"])
+        self.refresh_interval = tk.StringVar(value=self._DEFAULTS["refresh_interval"])
         
         # Trading settings
-        self.position_size = tk.StringVar(value=str(Config.POSITION_SIZE))
-        self.stop_loss_pct = tk.StringVar(value=str(Config.STOP_LOSS_PCT * 100))
-        self.take_profit_pct = tk.StringVar(value=str(Config.TAKE_PROFIT_PCT * 100))
+        self.position_size = tk.StringVar(value=self._DEFAULTS["position_size"])
+        self.stop_loss_pct = tk.StringVar(value=self._DEFAULTS["stop_loss_pct"])
+        self.take_profit_pct = tk.StringVar(value=self._DEFAULTS["take_profit_pct"])
         
         # VWAP strategy settings
-        self.vwap_buy_threshold = tk.StringVar(value=str(Config.VWAP_BUY_THRESHOLD))
-        self.vwap_sell_threshold = tk.StringVar(value=str(Config.VWAP_SELL_THRESHOLD))
-        self.rsi_overbought = tk.StringVar(value=str(Config.RSI_OVERBOUGHT))
-        self.rsi_period = tk.StringVar(value=str(Config.RSI_PERIOD))
-        
-        # Symbols
-        self.symbols = tk.StringVar(value=", ".join(Config.DEFAULT_SYMBOLS))
-        
-        # Account info
-        self.account_value_var = tk.StringVar(value="Not connected")
-        self.buying_power_var = tk.StringVar(value="Not connected")
-        self.cash_var = tk.StringVar(value="Not connected")
-        self.positions_var = tk.StringVar(value="0 positions")
+        self.vwap_buy_threshold = tk.StringVar(value=self._DEFAULTS["vwap_buy_threshold"])
+        self.vwap_sell_threshold = tk.StringVar(value=self._DEFAULTS["vwap_sell_threshold"])
+        self.rsi_overbought = tk.StringVar(value=self._DEFAULTS["rsi_overbought"])
+        self.rsi_period = tk.StringVar(value=self._DEFAULTS["rsi_period"])
+        
+        # Write traces as [variable, callback, trace id], detachable by _set_vars_batched
+        self._write_traces = []
+        
+        # Parsed copies of the numeric settings, refreshed whenever a variable is written
+        self._numeric_settings = {}
+        for name, convert in (('position_size', float), ('stop_loss_pct', float),
+                              ('take_profit_pct', float), ('vwap_buy_threshold', float),
+                              ('vwap_sell_threshold', float), ('rsi_overbought', float),
+                              ('rsi_period', int)):
+            var = getattr(self, name)
+            self._trace_write(var, lambda *args, n=name, c=convert: self._sync_float_cache(n, c))
+            self._trace_write(var, self._mark_dirty)
+            self._sync_float_cache(name, convert)
+        # Set by any edit since the last successful save_settings
+        self._settings_dirty = False
+        
+        # Symbols: the list/set are canonical, the string is only for display
+        # and persistence (re-parsed only when it is written from outside)
+        self.symbols = tk.StringVar()
+        self._set_symbols(list(dict.fromkeys(Config.DEFAULT_SYMBOLS)))
+        self._trace_write(self.symbols, self._on_symbols_changed)
+        
+        # (key, variable, default) per profile field, resolved once for profile save/load
+        self._profile_fields = tuple((key, getattr(self, key), self._DEFAULTS.get(key, ""))
+                                     for key in self._PROFILE_FIELDS)
+        
+        # Account info (last values rendered, to skip redundant updates)
+        self._acct_cache = None
+        # Display-variable writes buffered until the next idle pass
+        self._pending_sets = {}
+        self._flush_scheduled = False
+        self._last_acct_ts = float('-inf')  # time.monotonic() of the bot loop's last refresh
+        # Account Value / Buying Power / Cash / Open Positions, one line each
+        self.account_details_var = tk.StringVar(value="\n".join(value for _, value in _ACCOUNT_ROWS))
         
         # Market status
         self.market_status_var = tk.StringVar(value="Checking...")
         self.next_open_var = tk.StringVar(value="")
         self.status_var = tk.StringVar(value="Disconnected")
         self.last_update_var = tk.StringVar(value="Never")
+        self.current_profile_var = tk.StringVar(value="No profile loaded")
         
         # Setup GUI
         self.setup_styles()
         self.setup_layout()
         self.setup_dashboard()
-        self.setup_trading_settings()
-        self.setup_symbols()
-        self.setup_profiles()
+        # Settings, Symbols and Profiles are built the first time they are selected
+        self._tab_builders = {}
+        self._add_lazy_tab("settings_frame", "Trading Settings", self.setup_trading_settings)
+        self._add_lazy_tab("symbols_frame", "Symbols", self.setup_symbols)
+        self._add_lazy_tab("profiles_frame", "Profiles", self.setup_profiles)
         self.setup_logs()
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
         
         # Load profile data
         self.load_profile_data()
         
-        # Update profiles listbox after GUI is fully initialized
-        self.root.after(100, self.update_profiles_listbox)
-        
-        # Start market status updates
+        # Start market status updates (rescheduled for each market transition)
+        self._market_after_id = None
         self.update_market_status()
+        
+        # Start applying widget updates queued by the bot thread
+        self.root.after(UI_QUEUE_POLL_MS, self._process_ui_queue)
+        self.root.after(LOG_FLUSH_MS, self._flush_logs)
+    
+    @staticmethod
+    def _parse_symbols(symbols_text):
+        """
+        Parse a comma-separated symbols string.
+        
+        Args:
+            symbols_text (str): Symbols as stored in the symbols variable (comma,
+                space or newline separated)
+            
+        Returns:
+            list: Uppercased symbols in their original order, without duplicates
+        """
+        return list(dict.fromkeys(t.upper() for t in _SPLIT(symbols_text) if t))
+    
+    def _set_symbols(self, symbols):
+        """
+        Replace the symbol list and write its display string to the symbols variable.
+        
+        Args:
+            symbols (list): Normalized symbols without duplicates
+        """
+        # New objects rather than in-place edits, since the bot thread
+        # iterates over a snapshot of the list
+        self._symbols_list = symbols
+        self._symbol_set = set(symbols)
+        self._symbols_text = ", ".join(symbols)
+        self.symbols.set(self._symbols_text)
+    
+    def _on_symbols_changed(self, *args):
+        """Re-parse the cached symbol list when the symbols variable is written from outside."""
+        text = self.symbols.get()
+        if text != self._symbols_text:
+            self._symbols_list = self._parse_symbols(text)
+            self._symbol_set = set(self._symbols_list)
+            self._symbols_text = text
+    
+    def _trace_write(self, var, callback):
+        """
+        Register a write trace that _set_vars_batched can detach.
+        
+        Args:
+            var (tk.Variable): Variable to watch
+            callback: Called with the Tk trace arguments after each write
+        """
+        self._write_traces.append([var, callback, var.trace_add("write", callback)])
+    
+    def _set_vars_batched(self, updates):
+        """
+        Set several Tk variables with their write traces detached, then run
+        each affected trace callback once.
+        
+        Args:
+            updates (list): (variable, value) pairs
+        """
+        for trace in self._write_traces:
+            trace[0].trace_remove("write", trace[2])
+        try:
+            for var, value in updates:
+                var.set(value)
+        finally:
+            for trace in self._write_traces:
+                trace[2] = trace[0].trace_add("write", trace[1])
+        
+        updated = {str(var) for var, _ in updates}
+        for var, callback, _ in self._write_traces:
+            if str(var) in updated:
+                callback()
+    
+    def _sync_float_cache(self, name, convert):
+        """
+        Re-parse one numeric setting after its variable is written.
+        
+        Args:
+            name (str): Attribute name of the settings variable
+            convert (type): float or int
+        """
+        try:
+            self._numeric_settings[name] = convert(getattr(self, name).get())
+        except ValueError:
+            # Keep no value so save_settings reports the bad entry
+            self._numeric_settings[name] = None
+    
+    def _mark_dirty(self, *args):
+        """Record that a trading setting changed since the last save."""
+        self._settings_dirty = True
     
     def setup_window(self):
         """Configure the main window."""
         self.root.title("VWAP Reversion Trading Bot v1.1")
         self.root.geometry("1400x900")
         self.root.configure(bg="#ffffff")
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Set window icon if available
         try:
-            if PIL_AVAILABLE and os.path.exists("vwap-trader-logo.png"):
-                icon_image = Image.open("vwap-trader-logo.png")
-                icon_image = icon_image.resize((32, 32), Image.Resampling.LANCZOS)
+            icon_image = _logo_image(32)
+            if icon_image is not None:
                 icon_photo = ImageTk.PhotoImage(icon_image)
                 self.root.iconphoto(False, icon_photo)
         except Exception as e:
             print(f"Could not set window icon: {e}")
     
+    def on_close(self):
+        """Stop the background workers and close the window."""
+        self._stop_evt.set()
+        # Don't wait on in-flight Alpaca calls; queued ones are dropped
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._fetch_pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+    
     def setup_styles(self):
         """Configure custom styles."""
         style = ttk.Style()
@@ -124,24 +474,46 @@ class VWAPReversionGUI:
         style.map('TNotebook.Tab', background=[('selected', '#0b8fce')])
         
         # Configure button styles
-        try:
-            style.configure('Accent.TButton', 
-                           background='#0b8fce', 
-                           foreground='white',
-                           font=('Arial', 10, 'bold'))
+        _ensure_styles(style, self._font("Arial", 10, "bold"))
+    
+    def _font(self, family, size, weight="normal"):
+        """
+        Get a shared named font, creating it on first use.
+        
+        Args:
+            family (str): Font family
+            size (int): Point size
+            weight (str): "normal" or "bold"
             
-            style.configure('Success.TButton', 
-                           background='#00aa00', 
-                           foreground='white',
-                           font=('Arial', 10, 'bold'))
+        Returns:
+            tkfont.Font: Font object reused by every widget with this spec
+        """
+        key = (family, size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = tkfont.Font(root=self.root, family=family,
+                                                  size=size, weight=weight)
+        return font
+    
+    def _btn(self, parent, text, command, bg="#0b8fce", font=None, **options):
+        """
+        Create a button in the app's standard white-on-colour look.
+        
+        Args:
+            parent: Parent widget
+            text (str): Button label
+            command: Callback invoked on click
+            bg (str): Background colour
+            font: Label font (defaults to bold Arial 10)
+            **options: Extra tk.Button options (relief, padding, ...)
             
-            style.configure('Danger.TButton', 
-                           background='#aa0000', 
-                           foreground='white',
-                           font=('Arial', 10, 'bold'))
-        except Exception as e:
-            print(f"Warning: Could not configure custom button styles: {e}")
-            # Use default styles if custom styles fail
+        Returns:
+            tk.Button: The new (unpacked) button
+        """
+        if font is None:
+            font = self._font("Arial", 10, "bold")
+        return tk.Button(parent, text=text, command=command, bg=bg, fg="white",
+                         font=font, **options)
     
     def setup_layout(self):
         """Arrange widgets in the main window."""
@@ -152,6 +524,12 @@ class VWAPReversionGUI:
         # Header with logo
         self.setup_header()
         
+        # Status bar for non-error feedback that doesn't need a modal dialog
+        self.footer_status_var = tk.StringVar(value="")
+        footer_label = tk.Label(self.main_frame, textvariable=self.footer_status_var, bg="#f0f0f0",
+                                fg="#000000", font=self._font("Arial", 9), anchor="w", padx=10)
+        footer_label.pack(side="bottom", fill="x")
+        
         # Notebook for tabs
         self.notebook = ttk.Notebook(self.main_frame)
         self.notebook.pack(fill="both", expand=True, padx=10, pady=10)
@@ -163,10 +541,9 @@ class VWAPReversionGUI:
         header_frame.pack_propagate(False)
         
         # Logo
-        if PIL_AVAILABLE and os.path.exists("vwap-trader-logo.png"):
+        logo_image = _logo_image(64)
+        if logo_image is not None:
             try:
-                logo_image = Image.open("vwap-trader-logo.png")
-                logo_image = logo_image.resize((64, 64), Image.Resampling.LANCZOS)
                 self.logo_photo = ImageTk.PhotoImage(logo_image)
                 
                 logo_label = tk.Label(header_frame, image=self.logo_photo, bg="#ffffff")
@@ -180,12 +557,12 @@ class VWAPReversionGUI:
         
         title_label = tk.Label(title_frame, text="VWAP Reversion Trading Bot", 
                               bg="#ffffff", fg="#000000", 
-                              font=("Arial", 20, "bold"))
+                              font=self._font("Arial", 20, "bold"))
         title_label.pack(anchor="w")
         
         subtitle_label = tk.Label(title_frame, text="Intraday Mean Reversion Strategy", 
                                  bg="#ffffff", fg="#666666", 
-                                 font=("Arial", 12))
+                                 font=self._font("Arial", 12))
         subtitle_label.pack(anchor="w")
     
     def setup_dashboard(self):
@@ -202,7 +579,7 @@ class VWAPReversionGUI:
         header_frame.pack(fill="x", pady=(0, 10))
         
         tk.Label(header_frame, text="Account Information", bg="#ffffff", fg="#000000", 
-                font=("Arial", 14, "bold")).pack(side="left")
+                font=self._font("Arial", 14, "bold")).pack(side="left")
         
         # Horizontal line extending to the right
         tk.Frame(header_frame, height=2, bg="#cccccc").pack(side="left", fill="x", expand=True, padx=(10, 0))
@@ -211,43 +588,28 @@ class VWAPReversionGUI:
         account_details_frame = tk.Frame(account_frame, bg="#ffffff")
         account_details_frame.pack(fill="x", pady=10)
         
-        # Account value
-        tk.Label(account_details_frame, text="Account Value:", bg="#ffffff", fg="#000000", 
-                font=("Arial", 12)).grid(row=0, column=0, sticky="w", padx=(0, 10))
-        tk.Label(account_details_frame, textvariable=self.account_value_var, bg="#ffffff", 
-                fg="#000000", font=("Arial", 12, "bold")).grid(row=0, column=1, sticky="w")
-        
-        # Buying power
-        tk.Label(account_details_frame, text="Buying Power:", bg="#ffffff", fg="#000000", 
-                font=("Arial", 12)).grid(row=1, column=0, sticky="w", padx=(0, 10))
-        tk.Label(account_details_frame, textvariable=self.buying_power_var, bg="#ffffff", 
-                fg="#000000", font=("Arial", 12, "bold")).grid(row=1, column=1, sticky="w")
-        
-        # Cash
-        tk.Label(account_details_frame, text="Cash:", bg="#ffffff", fg="#000000", 
-                font=("Arial", 12)).grid(row=2, column=0, sticky="w", padx=(0, 10))
-        tk.Label(account_details_frame, textvariable=self.cash_var, bg="#ffffff", 
-                fg="#000000", font=("Arial", 12, "bold")).grid(row=2, column=1, sticky="w")
-        
-        # Positions
-        tk.Label(account_details_frame, text="Open Positions:", bg="#ffffff", fg="#000000", 
-                font=("Arial", 12)).grid(row=3, column=0, sticky="w", padx=(0, 10))
-        tk.Label(account_details_frame, textvariable=self.positions_var, bg="#ffffff", 
-                fg="#000000", font=("Arial", 12, "bold")).grid(row=3, column=1, sticky="w")
+        # Two multi-line labels (captions, values) instead of a label per cell;
+        # all four values change together, so they share one variable
+        tk.Label(account_details_frame, text="\n".join(caption for caption, _ in _ACCOUNT_ROWS),
+                 bg="#ffffff", fg="#000000", font=self._font("Arial", 12),
+                 justify="left").grid(row=0, column=0, sticky="nw", padx=(0, 10))
+        tk.Label(account_details_frame, textvariable=self.account_details_var, bg="#ffffff", 
+                 fg="#000000", font=self._font("Arial", 12, "bold"),
+                 justify="left").grid(row=0, column=1, sticky="nw")
         
         # Market Status section
         market_status_frame = tk.Frame(self.dashboard_frame, bg="#ffffff")
         market_status_frame.pack(fill="x", padx=20, pady=10)
         
         tk.Label(market_status_frame, text="Market:", bg="#ffffff", fg="#000000", 
-                font=("Arial", 12, "bold")).pack(side="left")
+                font=self._font("Arial", 12, "bold")).pack(side="left")
         self.market_status_label = tk.Label(market_status_frame, textvariable=self.market_status_var, 
-                                          bg="#ffffff", fg="#0b8fce", font=("Arial", 12))
+                                          bg="#ffffff", fg="#0b8fce", font=self._font("Arial", 12))
         self.market_status_label.pack(side="left", padx=10)
         
         # Next market open info
         self.next_open_label = tk.Label(market_status_frame, textvariable=self.next_open_var, 
-                                       bg="#ffffff", fg="#666666", font=("Arial", 10))
+                                       bg="#ffffff", fg="#666666", font=self._font("Arial", 10))
         self.next_open_label.pack(side="left", padx=20)
         
         # Status and Last Update (new line)
@@ -255,15 +617,15 @@ class VWAPReversionGUI:
         status_frame.pack(fill="x", padx=20, pady=(0, 10))
         
         tk.Label(status_frame, text="Status:", bg="#ffffff", fg="#000000", 
-                font=("Arial", 12, "bold")).pack(side="left")
+                font=self._font("Arial", 12, "bold")).pack(side="left")
         self.status_label = tk.Label(status_frame, textvariable=self.status_var, 
-                                   bg="#ffffff", fg="#ff0000", font=("Arial", 12))
+                                   bg="#ffffff", fg="#ff0000", font=self._font("Arial", 12))
         self.status_label.pack(side="left", padx=10)
         
         tk.Label(status_frame, text="Last Update:", bg="#ffffff", fg="#000000", 
-                font=("Arial", 12, "bold")).pack(side="left", padx=(20, 0))
+                font=self._font("Arial", 12, "bold")).pack(side="left", padx=(20, 0))
         self.last_update_label = tk.Label(status_frame, textvariable=self.last_update_var, 
-                                        bg="#ffffff", fg="#666666", font=("Arial", 12))
+                                        bg="#ffffff", fg="#666666", font=self._font("Arial", 12))
         self.last_update_label.pack(side="left", padx=10)
         
         # Control buttons
@@ -271,146 +633,165 @@ class VWAPReversionGUI:
         control_frame.pack(fill="x", padx=20, pady=20)
         
         # Use regular tkinter buttons instead of ttk for better compatibility
-        self.connect_btn = tk.Button(control_frame, text="Connect to Alpaca", 
-                                    command=self.connect_to_alpaca,
-                                    bg="#0b8fce", fg="white", font=("Arial", 10, "bold"),
-                                    relief="raised", bd=2, padx=10, pady=5)
+        self.connect_btn = self._btn(control_frame, "Connect to Alpaca", self.connect_to_alpaca,
+                                     relief="raised", bd=2, padx=10, pady=5)
         self.connect_btn.pack(side="left", padx=(0, 10))
         
-        self.start_btn = tk.Button(control_frame, text="Start Bot", 
-                                  command=self.start_bot,
-                                  bg="#0b8fce", fg="white", font=("Arial", 10, "bold"),
-                                  relief="raised", bd=2, padx=10, pady=5)
+        self.start_btn = self._btn(control_frame, "Start Bot", self.start_bot,
+                                   relief="raised", bd=2, padx=10, pady=5)
         self.start_btn.pack(side="left", padx=(0, 10))
         
-        self.stop_btn = tk.Button(control_frame, text="Stop Bot", 
-                                 command=self.stop_bot,
-                                 bg="#0b8fce", fg="white", font=("Arial", 10, "bold"),
-                                 relief="raised", bd=2, padx=10, pady=5)
+        self.stop_btn = self._btn(control_frame, "Stop Bot", self.stop_bot,
+                                  relief="raised", bd=2, padx=10, pady=5)
         self.stop_btn.pack(side="left", padx=(0, 10))
         
-        self.refresh_btn = tk.Button(control_frame, text="Refresh Data", 
-                                    command=self.refresh_data,
-                                    bg="#0b8fce", fg="white", font=("Arial", 10, "bold"),
-                                    relief="raised", bd=2, padx=10, pady=5)
+        self.refresh_btn = self._btn(control_frame, "Refresh Data",
+                                     lambda: self._debounce("refresh_data", REFRESH_DEBOUNCE_MS, self.refresh_data),
+                                     relief="raised", bd=2, padx=10, pady=5)
         self.refresh_btn.pack(side="left", padx=(0, 10))
         
         # Bot status
         self.bot_status_var = tk.StringVar(value="Bot stopped")
         self.bot_status_label = tk.Label(control_frame, textvariable=self.bot_status_var, 
-                                        bg="#ffffff", fg="#666666", font=("Arial", 12))
+                                        bg="#ffffff", fg="#666666", font=self._font("Arial", 12))
         self.bot_status_label.pack(side="left", padx=20)
     
+    def _add_lazy_tab(self, attr, text, builder):
+        """
+        Add an empty notebook tab whose widgets are built on first selection.
+        
+        Args:
+            attr (str): Attribute name for the tab's frame
+            text (str): Tab label
+            builder: Method that fills the frame
+        """
+        frame = tk.Frame(self.notebook, bg="#ffffff")
+        self.notebook.add(frame, text=text)
+        setattr(self, attr, frame)
+        self._tab_builders[str(frame)] = builder
+    
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab's widgets if this is its first selection."""
+        builder = self._tab_builders.pop(self.notebook.select(), None)
+        if builder is not None:
+            builder()
+    
     def setup_trading_settings(self):
-        """Setup trading settings tab."""
-        self.settings_frame = tk.Frame(self.notebook, bg="#ffffff")
-        self.notebook.add(self.settings_frame, text="Trading Settings")
-        
+        """Setup trading settings tab (into the frame made by _add_lazy_tab)."""
         # Position settings
         position_frame = tk.LabelFrame(self.settings_frame, text="Position Settings", 
-                                      bg="#ffffff", fg="#000000", font=("Arial", 12, "bold"))
+                                      bg="#ffffff", fg="#000000", font=self._font("Arial", 12, "bold"))
         position_frame.pack(fill="x", padx=20, pady=10)
         
+        # Keystrokes that can't lead to a number are rejected by the entry itself
+        float_vcmd = (self.root.register(lambda text: bool(_PARTIAL_FLOAT(text))), "%P")
+        int_vcmd = (self.root.register(lambda text: bool(_PARTIAL_INT(text))), "%P")
+        
         # Position size
         tk.Label(position_frame, text="Position Size ($):", bg="#ffffff", fg="#000000", 
-                font=("Arial", 10)).grid(row=0, column=0, sticky="w", padx=10, pady=5)
+                font=self._font("Arial", 10)).grid(row=0, column=0, sticky="w", padx=10, pady=5)
         position_entry = tk.Entry(position_frame, textvariable=self.position_size, 
-                                 font=("Arial", 10), width=15)
+                                 font=self._font("Arial", 10), width=15,
+                                 validate="key", validatecommand=float_vcmd)
         position_entry.grid(row=0, column=1, padx=10, pady=5)
         
         # Stop loss
         tk.Label(position_frame, text="Stop Loss (%):", bg="#ffffff", fg="#000000", 
-                font=("Arial", 10)).grid(row=1, column=0, sticky="w", padx=10, pady=5)
+                font=self._font("Arial", 10)).grid(row=1, column=0, sticky="w", padx=10, pady=5)
         stop_loss_entry = tk.Entry(position_frame, textvariable=self.stop_loss_pct, 
-                                  font=("Arial", 10), width=15)
+                                  font=self._font("Arial", 10), width=15,
+                                  validate="key", validatecommand=float_vcmd)
         stop_loss_entry.grid(row=1, column=1, padx=10, pady=5)
         
         # Take profit
         tk.Label(position_frame, text="Take Profit (%):", bg="#ffffff", fg="#000000", 
-                font=("Arial", 10)).grid(row=2, column=0, sticky="w", padx=10, pady=5)
+                font=self._font("Arial", 10)).grid(row=2, column=0, sticky="w", padx=10, pady=5)
         take_profit_entry = tk.Entry(position_frame, textvariable=self.take_profit_pct, 
-                                    font=("Arial", 10), width=15)
+                                    font=self._font("Arial", 10), width=15,
+                                    validate="key", validatecommand=float_vcmd)
         take_profit_entry.grid(row=2, column=1, padx=10, pady=5)
         
         # VWAP Strategy settings
         strategy_frame = tk.LabelFrame(self.settings_frame, text="VWAP Strategy Settings", 
-                                      bg="#ffffff", fg="#000000", font=("Arial", 12, "bold"))
+                                      bg="#ffffff", fg="#000000", font=self._font("Arial", 12, "bold"))
         strategy_frame.pack(fill="x", padx=20, pady=10)
         
         # VWAP buy threshold
         tk.Label(strategy_frame, text="VWAP Buy Threshold:", bg="#ffffff", fg="#000000", 
-                font=("Arial", 10)).grid(row=0, column=0, sticky="w", padx=10, pady=5)
+                font=self._font("Arial", 10)).grid(row=0, column=0, sticky="w", padx=10, pady=5)
         vwap_buy_entry = tk.Entry(strategy_frame, textvariable=self.vwap_buy_threshold, 
-                                 font=("Arial", 10), width=15)
+                                 font=self._font("Arial", 10), width=15,
+                                 validate="key", validatecommand=float_vcmd)
         vwap_buy_entry.grid(row=0, column=1, padx=10, pady=5)
         
         # VWAP sell threshold
         tk.Label(strategy_frame, text="VWAP Sell Threshold:", bg="#ffffff", fg="#000000", 
-                font=("Arial", 10)).grid(row=1, column=0, sticky="w", padx=10, pady=5)
+                font=self._font("Arial", 10)).grid(row=1, column=0, sticky="w", padx=10, pady=5)
         vwap_sell_entry = tk.Entry(strategy_frame, textvariable=self.vwap_sell_threshold, 
-                                  font=("Arial", 10), width=15)
+                                  font=self._font("Arial", 10), width=15,
+                                  validate="key", validatecommand=float_vcmd)
         vwap_sell_entry.grid(row=1, column=1, padx=10, pady=5)
         
         # RSI overbought
         tk.Label(strategy_frame, text="RSI Overbought Level:", bg="#ffffff", fg="#000000", 
-                font=("Arial", 10)).grid(row=2, column=0, sticky="w", padx=10, pady=5)
+                font=self._font("Arial", 10)).grid(row=2, column=0, sticky="w", padx=10, pady=5)
         rsi_overbought_entry = tk.Entry(strategy_frame, textvariable=self.rsi_overbought, 
-                                       font=("Arial", 10), width=15)
+                                       font=self._font("Arial", 10), width=15,
+                                       validate="key", validatecommand=float_vcmd)
         rsi_overbought_entry.grid(row=2, column=1, padx=10, pady=5)
         
         # RSI period
         tk.Label(strategy_frame, text="RSI Period:", bg="#ffffff", fg="#000000", 
-                font=("Arial", 10)).grid(row=3, column=0, sticky="w", padx=10, pady=5)
+                font=self._font("Arial", 10)).grid(row=3, column=0, sticky="w", padx=10, pady=5)
         rsi_period_entry = tk.Entry(strategy_frame, textvariable=self.rsi_period, 
-                                   font=("Arial", 10), width=15)
+                                   font=self._font("Arial", 10), width=15,
+                                   validate="key", validatecommand=int_vcmd)
         rsi_period_entry.grid(row=3, column=1, padx=10, pady=5)
         
         # Data refresh settings
         refresh_frame = tk.LabelFrame(self.settings_frame, text="Data Refresh Settings", 
-                                     bg="#ffffff", fg="#000000", font=("Arial", 12, "bold"))
+                                     bg="#ffffff", fg="#000000", font=self._font("Arial", 12, "bold"))
         refresh_frame.pack(fill="x", padx=20, pady=10)
         
         # Auto refresh checkbox
         auto_refresh_check = tk.Checkbutton(refresh_frame, text="Auto Refresh Data", 
                                            variable=self.auto_refresh, bg="#ffffff", 
-                                           fg="#000000", font=("Arial", 10))
+                                           fg="#000000", font=self._font("Arial", 10))
         auto_refresh_check.grid(row=0, column=0, sticky="w", padx=10, pady=5)
         
         # Refresh interval
         tk.Label(refresh_frame, text="Refresh Interval (minutes):", bg="#ffffff", fg="#000000", 
-                font=("Arial", 10)).grid(row=1, column=0, sticky="w", padx=10, pady=5)
+                font=self._font("Arial", 10)).grid(row=1, column=0, sticky="w", padx=10, pady=5)
         refresh_interval_combo = ttk.Combobox(refresh_frame, textvariable=self.refresh_interval, 
                                              values=["1", "5", "10", "15", "30", "60"], 
                                              width=12, state="readonly")
         refresh_interval_combo.grid(row=1, column=1, padx=10, pady=5)
         
         # Save settings button
-        save_btn = tk.Button(self.settings_frame, text="Save Settings", 
-                            command=self.save_settings,
-                            bg="#0b8fce", fg="white", font=("Arial", 10, "bold"),
-                            relief="raised", bd=2, padx=15, pady=5)
+        save_btn = self._btn(self.settings_frame, "Save Settings", self.save_settings,
+                             relief="raised", bd=2, padx=15, pady=5)
         save_btn.pack(pady=20)
     
     def setup_symbols(self):
-        """Setup symbols management tab."""
-        self.symbols_frame = tk.Frame(self.notebook, bg="#ffffff")
-        self.notebook.add(self.symbols_frame, text="Symbols")
-        
+        """Setup symbols management tab (into the frame made by _add_lazy_tab)."""
         # Title
         tk.Label(self.symbols_frame, text="Symbol Management", 
-                bg="#ffffff", fg="#000000", font=("Arial", 18, "bold")).pack(pady=20)
+                bg="#ffffff", fg="#000000", font=self._font("Arial", 18, "bold")).pack(pady=20)
         
         # Current symbols section
         current_frame = tk.LabelFrame(self.symbols_frame, text="Current Symbols", 
-                                     bg="#ffffff", fg="#000000", font=("Arial", 12, "bold"))
+                                     bg="#ffffff", fg="#000000", font=self._font("Arial", 12, "bold"))
         current_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
         # Current symbols listbox
         listbox_frame = tk.Frame(current_frame, bg="#ffffff")
         listbox_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
+        # Contents come from a Tcl list variable, replaced in one call per update
+        self._symbols_listvar = tk.Variable(value=())
         self.symbols_listbox = tk.Listbox(listbox_frame, bg="#f0f0f0", fg="#000000", 
-                                         font=("Arial", 11), height=8)
+                                         font=self._font("Arial", 11), height=8,
+                                         listvariable=self._symbols_listvar)
         self.symbols_listbox.pack(side="left", fill="both", expand=True)
         
         # Scrollbar for listbox
@@ -423,48 +804,38 @@ class VWAPReversionGUI:
         
         # Add/Remove individual symbols section
         individual_frame = tk.LabelFrame(self.symbols_frame, text="Add/Remove Individual Symbols", 
-                                        bg="#ffffff", fg="#000000", font=("Arial", 12, "bold"))
+                                        bg="#ffffff", fg="#000000", font=self._font("Arial", 12, "bold"))
         individual_frame.pack(fill="x", padx=20, pady=10)
         
         individual_buttons_frame = tk.Frame(individual_frame, bg="#ffffff")
         individual_buttons_frame.pack(fill="x", padx=10, pady=10)
         
-        add_symbol_btn = tk.Button(individual_buttons_frame, text="Add Symbol", 
-                                  command=self.add_symbol,
-                                  bg="#0b8fce", fg="white", font=("Arial", 10, "bold"),
-                                  relief="flat", padx=15, pady=5)
+        add_symbol_btn = self._btn(individual_buttons_frame, "Add Symbol", self.add_symbol,
+                                   relief="flat", padx=15, pady=5)
         add_symbol_btn.pack(side="left", padx=5)
         
-        remove_symbol_btn = tk.Button(individual_buttons_frame, text="Remove Symbol", 
-                                     command=self.remove_symbol,
-                                     bg="#aa0000", fg="white", font=("Arial", 10, "bold"),
-                                     relief="flat", padx=15, pady=5)
+        remove_symbol_btn = self._btn(individual_buttons_frame, "Remove Symbol", self.remove_symbol,
+                                      bg="#aa0000", relief="flat", padx=15, pady=5)
         remove_symbol_btn.pack(side="left", padx=5)
         
         # CSV Import/Export section
         csv_frame = tk.LabelFrame(self.symbols_frame, text="CSV Import/Export", 
-                                 bg="#ffffff", fg="#000000", font=("Arial", 12, "bold"))
+                                 bg="#ffffff", fg="#000000", font=self._font("Arial", 12, "bold"))
         csv_frame.pack(fill="x", padx=20, pady=10)
         
         csv_buttons_frame = tk.Frame(csv_frame, bg="#ffffff")
         csv_buttons_frame.pack(fill="x", padx=10, pady=10)
         
-        import_csv_btn = tk.Button(csv_buttons_frame, text="Import from CSV", 
-                                  command=self.import_csv,
-                                  bg="#0b8fce", fg="white", font=("Arial", 10, "bold"),
-                                  relief="flat", padx=15, pady=5)
+        import_csv_btn = self._btn(csv_buttons_frame, "Import from CSV", self.import_csv,
+                                   relief="flat", padx=15, pady=5)
         import_csv_btn.pack(side="left", padx=5)
         
-        export_csv_btn = tk.Button(csv_buttons_frame, text="Export to CSV", 
-                                  command=self.export_csv,
-                                  bg="#0b8fce", fg="white", font=("Arial", 10, "bold"),
-                                  relief="flat", padx=15, pady=5)
+        export_csv_btn = self._btn(csv_buttons_frame, "Export to CSV", self.export_csv,
+                                   relief="flat", padx=15, pady=5)
         export_csv_btn.pack(side="left", padx=5)
         
-        remove_all_btn = tk.Button(csv_buttons_frame, text="Clear All Symbols", 
-                                  command=self.remove_all_symbols,
-                                  bg="#dc3545", fg="white", font=("Arial", 10, "bold"),
-                                  relief="flat", padx=15, pady=5)
+        remove_all_btn = self._btn(csv_buttons_frame, "Clear All Symbols", self.remove_all_symbols,
+                                   bg="#dc3545", relief="flat", padx=15, pady=5)
         remove_all_btn.pack(side="left", padx=5)
         
         # CSV format help
@@ -473,76 +844,67 @@ class VWAPReversionGUI:
         
         help_text = "CSV Format: One symbol per line. Example: AAPL, NVDA, TSLA, AMZN, META"
         tk.Label(help_frame, text=help_text, bg="#ffffff", fg="#666666", 
-                font=("Arial", 9), wraplength=600).pack()
+                font=self._font("Arial", 9), wraplength=600).pack()
     
     def setup_profiles(self):
-        """Setup profiles management tab."""
-        self.profiles_frame = tk.Frame(self.notebook, bg="#ffffff")
-        self.notebook.add(self.profiles_frame, text="Profiles")
-        
+        """Setup profiles management tab (into the frame made by _add_lazy_tab)."""
         # Title
         tk.Label(self.profiles_frame, text="Profile Management", 
-                bg="#ffffff", fg="#000000", font=("Arial", 18, "bold")).pack(pady=20)
+                bg="#ffffff", fg="#000000", font=self._font("Arial", 18, "bold")).pack(pady=20)
         
         # Current profile section
         current_frame = tk.LabelFrame(self.profiles_frame, text="Current Profile", 
-                                     bg="#ffffff", fg="#000000", font=("Arial", 12, "bold"))
+                                     bg="#ffffff", fg="#000000", font=self._font("Arial", 12, "bold"))
         current_frame.pack(fill="x", padx=20, pady=10)
         
         # Current profile info
         current_info_frame = tk.Frame(current_frame, bg="#ffffff")
         current_info_frame.pack(fill="x", padx=10, pady=10)
         
-        self.current_profile_var = tk.StringVar(value="No profile loaded")
         tk.Label(current_info_frame, text="Current Profile:", bg="#ffffff", fg="#000000", 
-                font=("Arial", 10, "bold")).pack(side="left")
+                font=self._font("Arial", 10, "bold")).pack(side="left")
         tk.Label(current_info_frame, textvariable=self.current_profile_var, bg="#ffffff", 
-                fg="#0b8fce", font=("Arial", 10, "bold")).pack(side="left", padx=10)
+                fg="#0b8fce", font=self._font("Arial", 10, "bold")).pack(side="left", padx=10)
         
         # Profile management section
         management_frame = tk.LabelFrame(self.profiles_frame, text="Profile Management", 
-                                        bg="#ffffff", fg="#000000", font=("Arial", 12, "bold"))
+                                        bg="#ffffff", fg="#000000", font=self._font("Arial", 12, "bold"))
         management_frame.pack(fill="x", padx=20, pady=10)
         
         # Profile buttons
         profile_buttons_frame = tk.Frame(management_frame, bg="#ffffff")
         profile_buttons_frame.pack(fill="x", padx=10, pady=10)
         
-        save_profile_btn = tk.Button(profile_buttons_frame, text="Save Current Settings", 
-                                    command=self.save_profile,
-                                    bg="#0b8fce", fg="white", font=("Arial", 10, "bold"),
-                                    relief="flat", padx=15, pady=5)
+        save_profile_btn = self._btn(profile_buttons_frame, "Save Current Settings", self.save_profile,
+                                     relief="flat", padx=15, pady=5)
         save_profile_btn.pack(side="left", padx=5)
         
-        update_profile_btn = tk.Button(profile_buttons_frame, text="Update Current Profile", 
-                                      command=self.update_current_profile,
-                                      bg="#00aa00", fg="white", font=("Arial", 10, "bold"),
-                                      relief="flat", padx=15, pady=5)
+        update_profile_btn = self._btn(profile_buttons_frame, "Update Current Profile", self.update_current_profile,
+                                       bg="#00aa00", relief="flat", padx=15, pady=5)
         update_profile_btn.pack(side="left", padx=5)
         
-        load_profile_btn = tk.Button(profile_buttons_frame, text="Load Selected", 
-                                    command=self.load_selected_profile,
-                                    bg="#0b8fce", fg="white", font=("Arial", 10, "bold"),
-                                    relief="flat", padx=15, pady=5)
+        load_profile_btn = self._btn(profile_buttons_frame, "Load Selected", self.load_selected_profile,
+                                     relief="flat", padx=15, pady=5)
         load_profile_btn.pack(side="left", padx=5)
         
-        delete_profile_btn = tk.Button(profile_buttons_frame, text="Delete Selected", 
-                                      command=self.delete_selected_profile,
-                                      bg="#aa0000", fg="white", font=("Arial", 10, "bold"),
-                                      relief="flat", padx=15, pady=5)
+        delete_profile_btn = self._btn(profile_buttons_frame, "Delete Selected", self.delete_selected_profile,
+                                       bg="#aa0000", relief="flat", padx=15, pady=5)
         delete_profile_btn.pack(side="left", padx=5)
         
         # Available profiles section
         available_frame = tk.LabelFrame(self.profiles_frame, text="Available Profiles", 
-                                       bg="#ffffff", fg="#000000", font=("Arial", 12, "bold"))
+                                       bg="#ffffff", fg="#000000", font=self._font("Arial", 12, "bold"))
         available_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
         # Profiles listbox
         profiles_listbox_frame = tk.Frame(available_frame, bg="#ffffff")
         profiles_listbox_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
+        # Like the symbols listbox, contents are replaced through a Tcl list variable
+        self._profiles_listvar = tk.Variable(value=())
         self.profiles_listbox = tk.Listbox(profiles_listbox_frame, bg="#f0f0f0", fg="#000000", 
-                                          font=("Arial", 11), height=8, selectmode=tk.SINGLE)
+                                          font=self._font("Arial", 11), height=8, selectmode=tk.SINGLE,
+                                          listvariable=self._profiles_listvar)
         self.profiles_listbox.pack(side="left", fill="both", expand=True)
         
         # Scrollbar for profiles listbox
@@ -559,7 +921,7 @@ class VWAPReversionGUI:
         
         # Profile info section
         info_frame = tk.LabelFrame(self.profiles_frame, text="Profile Information", 
-                                  bg="#ffffff", fg="#000000", font=("Arial", 12, "bold"))
+                                  bg="#ffffff", fg="#000000", font=self._font("Arial", 12, "bold"))
         info_frame.pack(fill="x", padx=20, pady=10)
         
         info_text_frame = tk.Frame(info_frame, bg="#ffffff")
@@ -570,7 +932,7 @@ class VWAPReversionGUI:
                     "Select a profile from the list below and click 'Load Selected' or double-click to load. "
                     "Click 'Delete Selected' to remove a profile.")
         tk.Label(info_text_frame, text=info_text, bg="#ffffff", fg="#666666", 
-                font=("Arial", 9), wraplength=600, justify="left").pack()
+                font=self._font("Arial", 9), wraplength=600, justify="left").pack()
     
     def setup_logs(self):
         """Setup logs tab."""
@@ -582,7 +944,8 @@ class VWAPReversionGUI:
         logs_text_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
         self.logs_text = tk.Text(logs_text_frame, bg="#f8f8f8", fg="#000000", 
-                                font=("Consolas", 9), wrap="word")
+                                font=self._font("Consolas", 9), wrap="word",
+                                undo=False, maxundo=0, autoseparators=False)
         logs_scrollbar = tk.Scrollbar(logs_text_frame, orient="vertical", command=self.logs_text.yview)
         self.logs_text.configure(yscrollcommand=logs_scrollbar.set)
         
@@ -593,28 +956,94 @@ class VWAPReversionGUI:
         log_controls_frame = tk.Frame(self.logs_frame, bg="#ffffff")
         log_controls_frame.pack(fill="x", padx=20, pady=10)
         
-        clear_logs_btn = tk.Button(log_controls_frame, text="Clear Logs", 
-                                  command=self.clear_logs,
-                                  bg="#0b8fce", fg="white", font=("Arial", 9, "bold"),
-                                  relief="raised", bd=2, padx=8, pady=3)
+        clear_logs_btn = self._btn(log_controls_frame, "Clear Logs", self.clear_logs,
+                                   font=self._font("Arial", 9, "bold"), relief="raised", bd=2, padx=8, pady=3)
         clear_logs_btn.pack(side="left", padx=(0, 10))
         
-        export_logs_btn = tk.Button(log_controls_frame, text="Export Logs", 
-                                   command=self.export_logs,
-                                   bg="#0b8fce", fg="white", font=("Arial", 9, "bold"),
-                                   relief="raised", bd=2, padx=8, pady=3)
+        export_logs_btn = self._btn(log_controls_frame, "Export Logs", self.export_logs,
+                                    font=self._font("Arial", 9, "bold"), relief="raised", bd=2, padx=8, pady=3)
         export_logs_btn.pack(side="left", padx=(0, 10))
     
     def log_message(self, message: str):
         """Log a message to the GUI."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}\n"
+        self.log_messages((message,))
+    
+    def show_status(self, message: str):
+        """Show a message in the status bar and log it."""
+        self._set(self.footer_status_var, message)
+        self.log_message(message)
+    
+    def log_messages(self, messages):
+        """
+        Log several messages to the GUI with one timestamp and one buffer append.
+        
+        Args:
+            messages (list): Messages to log, in order
+        """
+        # The formatted clock only changes once per second
+        sec = int(time.time())
+        ts_cache = self._ts_cache
+        if sec != ts_cache[0]:
+            ts_cache = self._ts_cache = (sec, time.strftime("%H:%M:%S", time.localtime(sec)))
+        prefix = f"[{ts_cache[1]}] "
+        log_entries = [f"{prefix}{message}\n" for message in messages]
         
         if hasattr(self, 'logs_text') and self.logs_text:
-            self.logs_text.insert(tk.END, log_entry)
+            # Buffered here and written to the widget in batches by _flush_logs
+            with self._log_lock:
+                self._log_buf.extend(log_entries)
+        else:
+            for log_entry in log_entries:
+                print(log_entry.strip())
+    
+    def _flush_logs(self):
+        """Periodically move buffered log entries into the logs widget."""
+        self._write_pending_logs()
+        self.root.after(LOG_FLUSH_MS, self._flush_logs)
+    
+    def _write_pending_logs(self):
+        """Write buffered log entries to the logs widget in a single insert."""
+        with self._log_lock:
+            pending = list(self._log_buf)
+            self._log_buf.clear()
+        
+        if pending:
+            self.logs_text.insert(tk.END, "".join(pending))
+            
+            # Keep only the most recent MAX_LOG_LINES lines
+            line_count = int(self.logs_text.index("end-1c").split(".")[0])
+            if line_count > MAX_LOG_LINES:
+                self.logs_text.delete("1.0", f"{line_count - MAX_LOG_LINES + 1}.0")
+            
             self.logs_text.see(tk.END)
+    
+    def _run_on_main(self, func, *args):
+        """
+        Run a widget update on the Tk main thread.
+        
+        Tk widgets and variables must only be touched from the thread running
+        mainloop; calls from the bot thread are queued and applied by
+        _process_ui_queue instead.
+        """
+        if threading.current_thread() is threading.main_thread():
+            func(*args)
         else:
-            print(log_entry.strip())
+            self._ui_queue.put((func, args))
+    
+    def _process_ui_queue(self):
+        """Apply widget updates queued by background threads."""
+        while True:
+            try:
+                func, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"Error applying GUI update: {e}")
+        
+        self.root.after(UI_QUEUE_POLL_MS, self._process_ui_queue)
     
     def clear_logs(self):
         """Clear the logs."""
@@ -632,30 +1061,71 @@ class VWAPReversionGUI:
         )
         
         if filename:
-            try:
-                with open(filename, 'w') as f:
-                    f.write(self.logs_text.get(1.0, tk.END))
-                self.log_message(f"Logs exported to {filename}")
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to export logs: {e}")
+            self._write_pending_logs()
+            
+            # Take the widget's text segments here (Tk thread) and write them on the I/O pool
+            segments = [value for key, value, _ in self.logs_text.dump("1.0", tk.END, text=True)
+                        if key == "text"]
+            
+            def write(f):
+                f.writelines(segments)
+            
+            self._io_pool.submit(self._write_export, filename, write, {},
+                                 f"Logs exported to {filename}", "Failed to export logs")
+    
+    def _write_export(self, filename, write, open_options, message, error_text):
+        """
+        Write an export file off the Tk main thread and report the outcome.
+        
+        Args:
+            filename (str): Destination path
+            write: Called with the open text file to write the contents
+            open_options (dict): Extra open() keyword arguments (e.g. newline)
+            message (str): Status shown on success
+            error_text (str): Error dialog prefix on failure
+        """
+        try:
+            with open(filename, 'w', buffering=1 << 20, **open_options) as f:
+                write(f)
+            self._run_on_main(self.show_status, message)
+        except Exception as e:
+            self._run_on_main(messagebox.showerror, "Error", f"{error_text}: {e}")
     
     def connect_to_alpaca(self):
         """Connect to Alpaca API."""
+        # The API calls run on the I/O pool; the widgets are updated back on the main thread
+        self.connect_btn.config(state="disabled")
+        self._io_pool.submit(self._connect_worker)
+    
+    def _connect_worker(self):
+        """Test the Alpaca connection off the Tk main thread."""
         try:
             # Test the connection by getting account info
             account = self.trader.api.get_account()
-            self.log_message("✓ Connected to Alpaca API")
-            self.log_message(f"Account: {account.account_number}")
+            self.log_messages(("✓ Connected to Alpaca API", f"Account: {account.account_number}"))
             self.update_account_info()
+            self._run_on_main(self._on_connect_done, None)
+        except Exception as e:
+            self._run_on_main(self._on_connect_done, e)
+    
+    def _on_connect_done(self, error):
+        """
+        Show the result of a connection attempt.
+        
+        Args:
+            error (Exception): The connection error, or None on success
+        """
+        if error is None:
             self.connect_btn.config(text="Connected", state="disabled")
             
             # Update status and last update
             self.status_var.set("Connected")
             self.status_label.config(fg="#00aa00")  # Green
             self.last_update_var.set(time.strftime("%H:%M:%S"))
-        except Exception as e:
-            self.log_message(f"✗ Connection error: {e}")
-            messagebox.showerror("Connection Error", f"Connection error: {e}")
+        else:
+            self.connect_btn.config(state="normal")
+            self.log_message(f"✗ Connection error: {error}")
+            messagebox.showerror("Connection Error", f"Connection error: {error}")
             
             # Update status on error
             self.status_var.set("Disconnected")
@@ -664,61 +1134,116 @@ class VWAPReversionGUI:
     def update_account_info(self):
         """Update account information display."""
         try:
+            # API calls run on the calling thread; only the display update is marshaled
             account_info = self.trader.get_account_info()
             positions = self.trader.get_positions()
             
-            if account_info:
-                self.account_value_var.set(f"${account_info['equity']:,.2f}")
-                self.buying_power_var.set(f"${account_info['buying_power']:,.2f}")
-                self.cash_var.set(f"${account_info['balance']:,.2f}")
-                self.positions_var.set(f"{len(positions)} positions")
-                self.last_update_var.set(time.strftime("%H:%M:%S"))
-            else:
-                self.account_value_var.set("Error loading")
-                self.buying_power_var.set("Error loading")
-                self.cash_var.set("Error loading")
-                self.positions_var.set("Error loading")
+            self._run_on_main(self._show_account_info, account_info, positions)
             
         except Exception as e:
             self.log_message(f"Error updating account info: {e}")
-            self.account_value_var.set("Error")
-            self.buying_power_var.set("Error")
-            self.cash_var.set("Error")
-            self.positions_var.set("Error")
+            self._run_on_main(self._set_account_text, "Error")
+    
+    def _set(self, var, value):
+        """
+        Queue a display-variable write; all queued writes are applied in one
+        idle pass, and only where the value actually changed (Tk main thread only).
+        
+        Args:
+            var (tk.Variable): Variable to update
+            value: New value
+        """
+        self._pending_sets[str(var)] = (var, value)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after_idle(self._flush_sets)
+    
+    def _flush_sets(self):
+        """Apply the display-variable writes queued by _set."""
+        pending, self._pending_sets = self._pending_sets, {}
+        self._flush_scheduled = False
+        for var, value in pending.values():
+            if var.get() != value:
+                var.set(value)
+    
+    def _show_account_info(self, account_info, positions):
+        """Render account information (Tk main thread only)."""
+        if account_info:
+            # Skip re-formatting and variable writes when nothing changed since last tick
+            values = (account_info['equity'], account_info['buying_power'],
+                      account_info['balance'], len(positions))
+            if values != self._acct_cache:
+                self._acct_cache = values
+                equity, buying_power, balance, position_count = values
+                self._set(self.account_details_var,
+                          f"${equity:,.2f}\n${buying_power:,.2f}\n${balance:,.2f}\n"
+                          f"{position_count} positions")
+            self._set(self.last_update_var, time.strftime("%H:%M:%S"))
+        else:
+            self._set_account_text("Error loading")
+    
+    def _set_account_text(self, text):
+        """Show the same placeholder text in every account field."""
+        self._acct_cache = None
+        self._set(self.account_details_var, "\n".join([text] * len(_ACCOUNT_ROWS)))
     
     def update_market_status(self):
         """Update market status display."""
+        if threading.current_thread() is not threading.main_thread():
+            self._run_on_main(self.update_market_status)
+            return
+        
         try:
-            status = get_market_status()
+            status = _cached_market_status(int(time.time() // MARKET_STATUS_TTL))
             
             # Update market status
             if status['is_open']:
-                self.market_status_var.set("OPEN")
+                self._set(self.market_status_var, "OPEN")
                 self.market_status_label.config(fg="#00aa00")  # Green
-                self.next_open_var.set("")
+                self._set(self.next_open_var, "")
             elif status['is_premarket']:
-                self.market_status_var.set("PRE-MARKET")
+                self._set(self.market_status_var, "PRE-MARKET")
                 self.market_status_label.config(fg="#ff8800")  # Orange
                 next_open = status['market_open']
-                self.next_open_var.set(f"Opens at {next_open.strftime('%H:%M')} ET")
+                self._set(self.next_open_var, f"Opens at {next_open.strftime('%H:%M')} ET")
             elif status['is_afterhours']:
-                self.market_status_var.set("AFTER-HOURS")
+                self._set(self.market_status_var, "AFTER-HOURS")
                 self.market_status_label.config(fg="#ff8800")  # Orange
-                from market_hours import get_next_market_open
-                next_open = get_next_market_open()
-                self.next_open_var.set(f"Next open: {next_open.strftime('%m/%d %H:%M')} ET")
+                next_open = _cached_next_open(*_next_open_key(status['current_time']))
+                self._set(self.next_open_var, f"Next open: {next_open.strftime('%m/%d %H:%M')} ET")
             else:
-                self.market_status_var.set("CLOSED")
+                self._set(self.market_status_var, "CLOSED")
                 self.market_status_label.config(fg="#aa0000")  # Red
-                from market_hours import get_next_market_open
-                next_open = get_next_market_open()
-                self.next_open_var.set(f"Next open: {next_open.strftime('%m/%d %H:%M')} ET")
+                next_open = _cached_next_open(*_next_open_key(status['current_time']))
+                self._set(self.next_open_var, f"Next open: {next_open.strftime('%m/%d %H:%M')} ET")
                 
         except Exception as e:
-            self.market_status_var.set("ERROR")
+            self._set(self.market_status_var, "ERROR")
             self.market_status_label.config(fg="#aa0000")
-            self.next_open_var.set("")
+            self._set(self.next_open_var, "")
             self.log_message(f"Error updating market status: {e}")
+        
+        self._schedule_market_status()
+    
+    def _schedule_market_status(self):
+        """Schedule the next status refresh for just after the next market transition."""
+        if self._market_after_id is not None:
+            self.root.after_cancel(self._market_after_id)
+        
+        try:
+            delay = get_next_transition() - datetime.now(timezone.utc)
+            delay_ms = min(MARKET_STATUS_MAX_DELAY_MS, max(0, int(delay.total_seconds() * 1000)))
+        except Exception:
+            delay_ms = MARKET_STATUS_MAX_DELAY_MS
+        self._market_after_id = self.root.after(delay_ms + MARKET_TRANSITION_SLACK_MS,
+                                                self._on_market_transition)
+    
+    def _on_market_transition(self):
+        """Refresh the market status display once a transition has passed."""
+        self._market_after_id = None
+        # The cached status may predate the transition
+        _cached_market_status.cache_clear()
+        self.update_market_status()
     
     def start_bot(self):
         """Start the trading bot."""
@@ -731,8 +1256,11 @@ class VWAPReversionGUI:
         self.start_btn.config(state="disabled")
         self.stop_btn.config(state="normal")
         
+        # Fresh event per run so a loop still finishing a tick can't be revived
+        self._stop_evt = threading.Event()
+        
         # Start bot in separate thread
-        bot_thread = threading.Thread(target=self.run_bot_loop, daemon=True)
+        bot_thread = threading.Thread(target=self.run_bot_loop, args=(self._stop_evt,), daemon=True)
         bot_thread.start()
         
         self.log_message("VWAP Reversion Bot started")
@@ -740,17 +1268,44 @@ class VWAPReversionGUI:
     def stop_bot(self):
         """Stop the trading bot."""
         self.bot_running = False
+        self._stop_evt.set()
         self.bot_status_var.set("Bot stopped")
         self.start_btn.config(state="normal")
         self.stop_btn.config(state="disabled")
         
         self.log_message("VWAP Reversion Bot stopped")
     
+    def _debounce(self, key, delay_ms, func):
+        """
+        Run func once delay_ms after the last of a burst of calls with the same key.
+        
+        Args:
+            key (str): Identifies the debounced action
+            delay_ms (int): Quiet period before func runs
+            func: Callback (no arguments)
+        """
+        after_id = self._debounced.pop(key, None)
+        if after_id is not None:
+            self.root.after_cancel(after_id)
+        self._debounced[key] = self.root.after(delay_ms, self._run_debounced, key, func)
+    
+    def _run_debounced(self, key, func):
+        """Run a debounced callback scheduled by _debounce."""
+        self._debounced.pop(key, None)
+        func()
+    
     def refresh_data(self):
         """Manually refresh all data."""
+        if self._refresh_future is not None and not self._refresh_future.done():
+            self.log_message("Data refresh already in progress")
+            return
+        
+        self.log_message("Refreshing data...")
+        self._refresh_future = self._io_pool.submit(self._refresh_data_worker)
+    
+    def _refresh_data_worker(self):
+        """Refresh all data off the Tk main thread."""
         try:
-            self.log_message("Refreshing data...")
-            
             # Update market status
             self.update_market_status()
             
@@ -758,8 +1313,7 @@ class VWAPReversionGUI:
             self.update_account_info()
             
             # Update symbols data if we have symbols
-            symbols_list = [s.strip().upper() for s in self.symbols.get().split(",") if s.strip()]
-            if symbols_list:
+            if self._symbols_list:
                 self.update_symbols_data()
             else:
                 self.log_message("No symbols configured - add symbols in the Symbols tab")
@@ -768,26 +1322,47 @@ class VWAPReversionGUI:
             
         except Exception as e:
             self.log_message(f"Error refreshing data: {e}")
-            messagebox.showerror("Error", f"Error refreshing data: {e}")
+            self._run_on_main(messagebox.showerror, "Error", f"Error refreshing data: {e}")
     
-    def run_bot_loop(self):
-        """Main bot loop running in separate thread."""
-        while self.bot_running:
+    def run_bot_loop(self, stop_event):
+        """
+        Main bot loop running in separate thread.
+        
+        Args:
+            stop_event (threading.Event): Set by stop_bot to end the loop
+        """
+        bar_seconds = BAR_SECONDS.get(Config.TIMEFRAME, 60)
+        analyzed_bar = None  # Index of the last bar the strategy ran on
+        while not stop_event.is_set():
+            wait = 60
             try:
-                # Always update market status
-                self.update_market_status()
-                
+                # The status display reschedules itself at each market transition
                 # Check if market is open before running trading logic
-                status = get_market_status()
+                status = _cached_market_status(int(time.time() // MARKET_STATUS_TTL))
                 
-                if status['is_open']:
-                    # Market is open - run full trading logic
+                # The account barely changes while closed, so refresh it less often
+                now = time.monotonic()
+                refresh_every = ACCOUNT_REFRESH_OPEN if status['is_open'] else ACCOUNT_REFRESH_CLOSED
+                if now - self._last_acct_ts >= refresh_every:
                     self.update_account_info()
-                    self.update_symbols_data()
-                    self.log_message("Market is open - running VWAP Reversion analysis")
+                    self._last_acct_ts = now
+                
+                if status['is_open']:
+                    # Market is open - run full trading logic, but only once per
+                    # bar: between closes a fetch would return the same bars
+                    since_epoch = time.time() - BAR_CLOSE_SLACK
+                    bar = int(since_epoch // bar_seconds)
+                    if bar != analyzed_bar:
+                        analyzed_bar = bar
+                        self.update_symbols_data()
+                        self.log_message("Market is open - running VWAP Reversion analysis")
+                    
+                    # Wake for the next bar close or the next account refresh
+                    to_next_bar = bar_seconds - since_epoch % bar_seconds
+                    to_account = refresh_every - (time.monotonic() - self._last_acct_ts)
+                    wait = max(1.0, min(to_next_bar, to_account))
                 else:
-                    # Market is closed - only update account info
-                    self.update_account_info()
+                    # Market is closed - only account info (throttled above)
                     if status['is_weekend']:
                         self.log_message("Market closed (weekend) - minimal updates only")
                     elif status['is_holiday']:
@@ -795,66 +1370,106 @@ class VWAPReversionGUI:
                     else:
                         self.log_message("Market closed - minimal updates only")
                 
-                time.sleep(60)  # Bot checks every 60 seconds
+                # Wakes immediately when stopped
+                if stop_event.wait(wait):
+                    break
             except Exception as e:
                 self.log_message(f"Bot error: {e}")
-                time.sleep(60)
+                if stop_event.wait(60):
+                    break
     
     def update_symbols_data(self):
         """Update data for all symbols."""
+        # Analysis lines for this pass, logged together at the end
+        lines = []
         try:
-            symbols_list = [s.strip().upper() for s in self.symbols.get().split(",") if s.strip()]
+            # Snapshot of the normalized list kept current by the symbols trace
+            symbols_list = self._symbols_list
+            
+            if not symbols_list:
+                return
+            
+            # Fetch bars with one multi-symbol request per block of symbols, the
+            # blocks concurrently (network-bound), so the indicators can then be
+            # computed in one batch
+            futures = [self._fetch_pool.submit(self.trader.get_historical_data_bulk,
+                                               symbols_list[i:i + SYMBOLS_PER_BARS_REQUEST],
+                                               Config.TIMEFRAME)
+                       for i in range(0, len(symbols_list), SYMBOLS_PER_BARS_REQUEST)]
+            bars_by_symbol = {}
+            for future in futures:
+                bars_by_symbol.update(future.result())
             
+            analyzed_symbols = []
+            frames = []
             for symbol in symbols_list:
                 try:
                     # Get historical data
-                    df = self.trader.get_historical_data(symbol, Config.TIMEFRAME)
+                    df = bars_by_symbol.get(symbol)
                     
-                    if not validate_data_quality(df, min_bars=5):
-                        self.log_message(f"Insufficient data for {symbol}")
+                    if df is None or not validate_data_quality(df, min_bars=5):
+                        lines.append(f"Insufficient data for {symbol}")
                         continue
                     
-                    # Calculate indicators
-                    df = calculate_all_indicators(df, Config.RSI_PERIOD)
-                    
-                    # Get latest signals
-                    signals = get_latest_signals(df)
+                    analyzed_symbols.append(symbol)
+                    frames.append(df)
+                
+                except Exception as e:
+                    lines.append(f"Error analyzing {symbol}: {e}")
+                    continue
+            
+            # Calculate indicators and get latest signals for all symbols
+            batch_signals = calculate_latest_signals_batch(frames, Config.RSI_PERIOD)
+            
+            # Check for signals, for all symbols at once
+            decisions = self.strategy.get_signals_batch(analyzed_symbols, batch_signals)
+            
+            for symbol, signals, decision in zip(analyzed_symbols, batch_signals, decisions):
+                try:
                     if not signals:
                         continue
                     
-                    # Check for signals
-                    if self.strategy.get_buy_signal(signals, symbol):
-                        self.log_message(f"{symbol} → BUY signal (Price: ${signals['close']:.2f}, VWAP: ${signals['vwap']:.2f})")
-                    elif self.strategy.get_sell_signal(signals, symbol):
-                        self.log_message(f"{symbol} → SELL signal (Price: ${signals['close']:.2f}, VWAP: ${signals['vwap']:.2f})")
-                    else:
-                        self.log_message(f"{symbol} → HOLD (Price: ${signals['close']:.2f}, VWAP: ${signals['vwap']:.2f})")
+                    lines.append(f"{symbol} → {_DECISION_LABELS[decision]} "
+                                 f"(Price: ${signals['close']:.2f}, VWAP: ${signals['vwap']:.2f})")
                 
                 except Exception as e:
-                    self.log_message(f"Error analyzing {symbol}: {e}")
+                    lines.append(f"Error analyzing {symbol}: {e}")
                     continue
         
         except Exception as e:
-            self.log_message(f"Error updating symbols data: {e}")
+            lines.append(f"Error updating symbols data: {e}")
+        finally:
+            if lines:
+                self.log_messages(lines)
     
     def save_settings(self):
         """Save trading settings."""
+        if not self._settings_dirty:
+            self.show_status("No settings changed - nothing to save")
+            return
+        
         try:
+            values = self._numeric_settings
+            invalid = [name for name, value in values.items() if value is None]
+            if invalid:
+                raise ValueError(f"invalid value for {', '.join(invalid)}")
+            
             # Update strategy parameters
             self.strategy.update_parameters(
-                vwap_threshold_buy=float(self.vwap_buy_threshold.get()),
-                vwap_threshold_sell=float(self.vwap_sell_threshold.get()),
-                rsi_overbought=float(self.rsi_overbought.get()),
-                rsi_period=int(self.rsi_period.get())
+                vwap_threshold_buy=values['vwap_buy_threshold'],
+                vwap_threshold_sell=values['vwap_sell_threshold'],
+                rsi_overbought=values['rsi_overbought'],
+                rsi_period=values['rsi_period']
             )
             
             # Update trader settings
             self.trader.update_trading_settings(
-                position_size=float(self.position_size.get()),
-                stop_loss_pct=float(self.stop_loss_pct.get()) / 100,
-                take_profit_pct=float(self.take_profit_pct.get()) / 100
+                position_size=values['position_size'],
+                stop_loss_pct=values['stop_loss_pct'] / 100,
+                take_profit_pct=values['take_profit_pct'] / 100
             )
             
+            self._settings_dirty = False
             self.log_message("Settings saved successfully")
             messagebox.showinfo("Success", "Settings saved successfully")
         
@@ -865,19 +1480,13 @@ class VWAPReversionGUI:
     def update_symbols_listbox(self):
         """Update the symbols listbox display."""
         if hasattr(self, 'symbols_listbox'):
-            self.symbols_listbox.delete(0, tk.END)
-            current_symbols = [s.strip() for s in self.symbols.get().split(",") if s.strip()]
-            for symbol in current_symbols:
-                self.symbols_listbox.insert(tk.END, symbol)
+            self._symbols_listvar.set(tuple(self._symbols_list))
     
     def update_profiles_listbox(self):
         """Update the profiles listbox display."""
         if hasattr(self, 'profiles_listbox'):
-            self.profiles_listbox.delete(0, tk.END)
             try:
-                profiles = self.profile_manager.list_profiles()
-                for profile in profiles:
-                    self.profiles_listbox.insert(tk.END, profile)
+                self._profiles_listvar.set(tuple(self.profile_manager.list_profiles()))
             except Exception as e:
                 self.log_message(f"Error loading profiles: {e}")
     
@@ -886,35 +1495,34 @@ class VWAPReversionGUI:
         symbol = simpledialog.askstring("Add Symbol", "Enter symbol to add:")
         if symbol:
             symbol = symbol.strip().upper()
-            current_symbols = [s.strip() for s in self.symbols.get().split(",") if s.strip()]
-            if symbol not in current_symbols:
-                current_symbols.append(symbol)
-                self.symbols.set(", ".join(current_symbols))
-                self.update_symbols_listbox()
-                self.log_message(f"Added symbol: {symbol}")
+            if not _SYMBOL_RE.match(symbol):
+                messagebox.showerror("Error", f"Invalid symbol: {symbol}")
+                return
+            if symbol not in self._symbol_set:
+                self._set_symbols(self._symbols_list + [symbol])
+                self._debounce("symbols_listbox", LISTBOX_DEBOUNCE_MS, self.update_symbols_listbox)
+                self.show_status(f"Added symbol: {symbol}")
             else:
-                messagebox.showinfo("Info", f"Symbol {symbol} already exists")
+                self.show_status(f"Symbol {symbol} already exists")
     
     def remove_symbol(self):
         """Remove a symbol."""
         symbol = simpledialog.askstring("Remove Symbol", "Enter symbol to remove:")
         if symbol:
             symbol = symbol.strip().upper()
-            current_symbols = [s.strip() for s in self.symbols.get().split(",") if s.strip()]
-            if symbol in current_symbols:
-                current_symbols.remove(symbol)
-                self.symbols.set(", ".join(current_symbols))
-                self.update_symbols_listbox()
-                self.log_message(f"Removed symbol: {symbol}")
+            if symbol in self._symbol_set:
+                self._set_symbols([s for s in self._symbols_list if s != symbol])
+                self._debounce("symbols_listbox", LISTBOX_DEBOUNCE_MS, self.update_symbols_listbox)
+                self.show_status(f"Removed symbol: {symbol}")
             else:
-                messagebox.showinfo("Info", f"Symbol {symbol} not found")
+                self.show_status(f"Symbol {symbol} not found")
     
     def remove_all_symbols(self):
         """Remove all symbols."""
-        current_symbols = [s.strip() for s in self.symbols.get().split(",") if s.strip()]
+        current_symbols = self._symbols_list
         
         if not current_symbols:
-            messagebox.showinfo("Info", "No symbols to remove")
+            self.show_status("No symbols to remove")
             return
         
         # Ask for confirmation
@@ -923,10 +1531,9 @@ class VWAPReversionGUI:
                                    f"Symbols: {', '.join(current_symbols)}")
         
         if result:
-            self.symbols.set("")
-            self.update_symbols_listbox()
-            self.log_message(f"Removed all {len(current_symbols)} symbols")
-            messagebox.showinfo("Success", f"Removed all {len(current_symbols)} symbols")
+            self._set_symbols([])
+            self._debounce("symbols_listbox", LISTBOX_DEBOUNCE_MS, self.update_symbols_listbox)
+            self.show_status(f"Removed all {len(current_symbols)} symbols")
     
     def import_csv(self):
         """Import symbols from CSV file."""
@@ -936,19 +1543,20 @@ class VWAPReversionGUI:
         
         if filename:
             try:
-                symbols = []
-                with open(filename, 'r') as f:
-                    reader = csv.reader(f)
-                    for row in reader:
-                        if row and row[0].strip():
-                            symbols.append(row[0].strip().upper())
+                # First column of each line, deduped in insertion order
+                with open(filename, 'rb') as f:
+                    cells = list(dict.fromkeys(cell for cell in _iter_first_cells(f) if cell))
+                # Drop rows that can't be tickers (headers, notes) before they reach the API
+                symbols = [cell for cell in cells if _SYMBOL_RE.match(cell)]
                 
                 if symbols:
-                    self.symbols.set(", ".join(symbols))
-                    self.update_symbols_listbox()
-                    self.log_message(f"Imported {len(symbols)} symbols from CSV")
+                    self._set_symbols(symbols)
+                    self._debounce("symbols_listbox", LISTBOX_DEBOUNCE_MS, self.update_symbols_listbox)
+                    skipped = len(cells) - len(symbols)
+                    self.show_status(f"Imported {len(symbols)} symbols from CSV"
+                                     + (f" ({skipped} invalid skipped)" if skipped else ""))
                 else:
-                    messagebox.showinfo("Info", "No symbols found in CSV file")
+                    self.show_status("No symbols found in CSV file")
             
             except Exception as e:
                 messagebox.showerror("Error", f"Error importing CSV: {e}")
@@ -961,38 +1569,24 @@ class VWAPReversionGUI:
         )
         
         if filename:
-            try:
-                symbols = [s.strip() for s in self.symbols.get().split(",") if s.strip()]
-                with open(filename, 'w', newline='') as f:
-                    writer = csv.writer(f)
-                    for symbol in symbols:
-                        writer.writerow([symbol])
-                
-                self.log_message(f"Exported {len(symbols)} symbols to CSV")
+            # _set_symbols replaces the list rather than mutating it, so the worker can keep this one
+            symbols = self._symbols_list
             
-            except Exception as e:
-                messagebox.showerror("Error", f"Error exporting CSV: {e}")
+            def write(f):
+                csv.writer(f).writerows((symbol,) for symbol in symbols)
+            
+            self._io_pool.submit(self._write_export, filename, write, {'newline': ''},
+                                 f"Exported {len(symbols)} symbols to CSV", "Error exporting CSV")
     
     def save_profile(self):
         """Save current settings as a profile."""
         profile_name = simpledialog.askstring("Save Profile", "Enter profile name:")
         if profile_name:
             try:
-                profile_data = {
-                    "symbols": self.symbols.get(),
-                    "position_size": self.position_size.get(),
-                    "stop_loss_pct": self.stop_loss_pct.get(),
-                    "take_profit_pct": self.take_profit_pct.get(),
-                    "vwap_buy_threshold": self.vwap_buy_threshold.get(),
-                    "vwap_sell_threshold": self.vwap_sell_threshold.get(),
-                    "rsi_overbought": self.rsi_overbought.get(),
-                    "rsi_period": self.rsi_period.get(),
-                    "refresh_interval": self.refresh_interval.get(),
-                    "auto_refresh": self.auto_refresh.get()
-                }
+                profile_data = self._profile_dict()
                 
                 self.profile_manager.save_profile(profile_name, profile_data)
-                self.update_profiles_listbox()
+                self._debounce("profiles_listbox", LISTBOX_DEBOUNCE_MS, self.update_profiles_listbox)
                 self.current_profile_var.set(profile_name)
                 self.log_message(f"Profile '{profile_name}' saved successfully")
                 messagebox.showinfo("Success", f"Profile '{profile_name}' saved successfully")
@@ -1009,21 +1603,10 @@ class VWAPReversionGUI:
             return
         
         try:
-            profile_data = {
-                "symbols": self.symbols.get(),
-                "position_size": self.position_size.get(),
-                "stop_loss_pct": self.stop_loss_pct.get(),
-                "take_profit_pct": self.take_profit_pct.get(),
-                "vwap_buy_threshold": self.vwap_buy_threshold.get(),
-                "vwap_sell_threshold": self.vwap_sell_threshold.get(),
-                "rsi_overbought": self.rsi_overbought.get(),
-                "rsi_period": self.rsi_period.get(),
-                "refresh_interval": self.refresh_interval.get(),
-                "auto_refresh": self.auto_refresh.get()
-            }
+            profile_data = self._profile_dict()
             
             self.profile_manager.save_profile(current_profile, profile_data)
-            self.update_profiles_listbox()
+            self._debounce("profiles_listbox", LISTBOX_DEBOUNCE_MS, self.update_profiles_listbox)
             self.log_message(f"Profile '{current_profile}' updated successfully")
             messagebox.showinfo("Success", f"Profile '{current_profile}' updated successfully")
         
@@ -1042,18 +1625,9 @@ class VWAPReversionGUI:
         try:
             profile_data = self.profile_manager.get_profile_data(profile_name)
             if profile_data:
-                self.symbols.set(profile_data.get("symbols", ""))
-                self.position_size.set(profile_data.get("position_size", str(Config.POSITION_SIZE)))
-                self.stop_loss_pct.set(profile_data.get("stop_loss_pct", str(Config.STOP_LOSS_PCT * 100)))
-                self.take_profit_pct.set(profile_data.get("take_profit_pct", str(Config.TAKE_PROFIT_PCT * 100)))
-                self.vwap_buy_threshold.set(profile_data.get("vwap_buy_threshold", str(Config.VWAP_BUY_THRESHOLD)))
-                self.vwap_sell_threshold.set(profile_data.get("vwap_sell_threshold", str(Config.VWAP_SELL_THRESHOLD)))
-                self.rsi_overbought.set(profile_data.get("rsi_overbought", str(Config.RSI_OVERBOUGHT)))
-                self.rsi_period.set(profile_data.get("rsi_period", str(Config.RSI_PERIOD)))
-                self.refresh_interval.set(profile_data.get("refresh_interval", "5"))
-                self.auto_refresh.set(profile_data.get("auto_refresh", True))
+                self._apply_profile_dict(profile_data)
                 
-                self.update_symbols_listbox()
+                self._debounce("symbols_listbox", LISTBOX_DEBOUNCE_MS, self.update_symbols_listbox)
                 self.current_profile_var.set(profile_name)
                 self.log_message(f"Profile '{profile_name}' loaded successfully")
                 messagebox.showinfo("Success", f"Profile '{profile_name}' loaded successfully")
@@ -1063,6 +1637,26 @@ class VWAPReversionGUI:
         except Exception as e:
             messagebox.showerror("Error", f"Error loading profile: {e}")
     
+    def _profile_dict(self):
+        """
+        Collect the current settings in profile form.
+        
+        Returns:
+            dict: Value of every profile field, keyed by field name
+        """
+        return {key: var.get() for key, var, _ in self._profile_fields}
+    
+    def _apply_profile_dict(self, profile_data):
+        """
+        Load profile settings into the Tk variables.
+        
+        Args:
+            profile_data (dict): Profile data; missing keys fall back to _DEFAULTS
+        """
+        # Set everything with the traces detached; each trace then runs once
+        self._set_vars_batched([(var, profile_data.get(key, default))
+                                for key, var, default in self._profile_fields])
+    
     def load_profile(self):
         """Load a saved profile (legacy method for compatibility)."""
         self.load_selected_profile()
@@ -1084,7 +1678,7 @@ class VWAPReversionGUI:
         if result:
             try:
                 self.profile_manager.delete_profile(profile_name)
-                self.update_profiles_listbox()
+                self._debounce("profiles_listbox", LISTBOX_DEBOUNCE_MS, self.update_profiles_listbox)
                 if self.current_profile_var.get() == profile_name:
                     self.current_profile_var.set("No profile loaded")
                 self.log_message(f"Profile '{profile_name}' deleted successfully")
@@ -1109,16 +1703,7 @@ class VWAPReversionGUI:
                 return
             
             # Load profile data
-            self.symbols.set(profile_data.get("symbols", ""))
-            self.position_size.set(profile_data.get("position_size", str(Config.POSITION_SIZE)))
-            self.stop_loss_pct.set(profile_data.get("stop_loss_pct", str(Config.STOP_LOSS_PCT * 100)))
-            self.take_profit_pct.set(profile_data.get("take_profit_pct", str(Config.TAKE_PROFIT_PCT * 100)))
-            self.vwap_buy_threshold.set(profile_data.get("vwap_buy_threshold", str(Config.VWAP_BUY_THRESHOLD)))
-            self.vwap_sell_threshold.set(profile_data.get("vwap_sell_threshold", str(Config.VWAP_SELL_THRESHOLD)))
-            self.rsi_overbought.set(profile_data.get("rsi_overbought", str(Config.RSI_OVERBOUGHT)))
-            self.rsi_period.set(profile_data.get("rsi_period", str(Config.RSI_PERIOD)))
-            self.refresh_interval.set(profile_data.get("refresh_interval", "5"))
-            self.auto_refresh.set(profile_data.get("auto_refresh", True))
+            self._apply_profile_dict(profile_data)
             
             # Update current profile display
             self.current_profile_var.set("default")
@@ -1136,7 +1721,23 @@ class VWAPReversionGUI:
         # Initial market status update
         self.update_market_status()
         
+        # Load the file dialog's Tcl code once the window is up, not on the first CSV click
+        self.root.after_idle(self._prewarm_file_dialog)
+        
         self.root.mainloop()
+    
+    def _prewarm_file_dialog(self):
+        """
+        Source Tk's Tcl file dialog ahead of its first use.
+        
+        Only X11 uses the Tcl implementation (tkfbox.tcl, auto-loaded on first
+        use); Windows and macOS show native dialogs with nothing to preload.
+        """
+        try:
+            if self.root.tk.call('tk', 'windowingsystem') == 'x11':
+                self.root.tk.eval('catch {auto_load ::tk::dialog::file::}')
+        except tk.TclError:
+            pass
 
 def main():
     """Main function to run the GUI."""
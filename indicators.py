@@ -6,10 +6,131 @@ Author: Trevor Hunter
 Version: 1.0
 """
 
+import threading
 import pandas as pd
 import numpy as np
 import ta
 
+# Numba is optional; without it the batched helpers use the pandas path
+try:
+    from numba import guvectorize, njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Batch size from which calculate_latest_signals_batch computes rows in parallel
+PARALLEL_BATCH_MIN = 256
+_PARALLEL_LOCK = threading.Lock()
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _fused_vwap_rsi(high, low, close, volume, period):
+        """
+        Latest VWAP and RSI of a bar array in one sequential pass.
+        
+        Matches calculate_vwap and ta's RSIIndicator (Wilder smoothing,
+        min_periods=period) evaluated at the last bar.
+        """
+        alpha = 1.0 / period
+        sum_pv = 0.0
+        sum_v = 0.0
+        avg_gain = 0.0
+        avg_loss = 0.0
+        for i in range(close.shape[0]):
+            sum_pv += (high[i] + low[i] + close[i]) / 3.0 * volume[i]
+            sum_v += volume[i]
+            if i > 0:
+                diff = close[i] - close[i - 1]
+                gain = diff if diff > 0 else 0.0
+                loss = -diff if diff < 0 else 0.0
+                avg_gain = (1.0 - alpha) * avg_gain + alpha * gain
+                avg_loss = (1.0 - alpha) * avg_loss + alpha * loss
+        
+        vwap = sum_pv / sum_v if sum_v != 0 else np.nan
+        if close.shape[0] < period:
+            rsi = np.nan
+        elif avg_loss == 0:
+            rsi = 100.0
+        else:
+            rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        return vwap, rsi
+    
+    @njit(cache=True)
+    def _wilder_rsi(close, period):
+        """
+        RSI of every bar in one pass over a float64 close array.
+        
+        Same values as ta's RSIIndicator: Wilder smoothing with
+        alpha = 1/period, NaN for the first period - 1 bars.
+        """
+        n = close.shape[0]
+        out = np.empty(n)
+        alpha = 1.0 / period
+        avg_gain = 0.0
+        avg_loss = 0.0
+        for i in range(n):
+            if i > 0:
+                diff = close[i] - close[i - 1]
+                gain = diff if diff > 0 else 0.0
+                loss = -diff if diff < 0 else 0.0
+                avg_gain = (1.0 - alpha) * avg_gain + alpha * gain
+                avg_loss = (1.0 - alpha) * avg_loss + alpha * loss
+            if i < period - 1:
+                out[i] = np.nan
+            elif avg_loss == 0:
+                out[i] = 100.0
+            else:
+                out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        return out
+    
+    @njit(cache=True)
+    def _vwap_rsi_series(high, low, close, volume, period):
+        """
+        VWAP and RSI of every bar, computed together in one pass.
+        
+        Same values as calculate_vwap and _wilder_rsi, but each bar's
+        columns are read once for both indicators.
+        """
+        n = close.shape[0]
+        vwap = np.empty(n)
+        rsi = np.empty(n)
+        alpha = 1.0 / period
+        sum_pv = 0.0
+        sum_v = 0.0
+        avg_gain = 0.0
+        avg_loss = 0.0
+        for i in range(n):
+            sum_pv += (high[i] + low[i] + close[i]) / 3.0 * volume[i]
+            sum_v += volume[i]
+            vwap[i] = sum_pv / sum_v if sum_v != 0 else np.nan
+            
+            if i > 0:
+                diff = close[i] - close[i - 1]
+                gain = diff if diff > 0 else 0.0
+                loss = -diff if diff < 0 else 0.0
+                avg_gain = (1.0 - alpha) * avg_gain + alpha * gain
+                avg_loss = (1.0 - alpha) * avg_loss + alpha * loss
+            if i < period - 1:
+                rsi[i] = np.nan
+            elif avg_loss == 0:
+                rsi[i] = 100.0
+            else:
+                rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        return vwap, rsi
+    
+    def _latest_vwap_rsi_row(high, low, close, volume, length, period, vwap_out, rsi_out):
+        """Latest VWAP and RSI of one right-padded row of bars."""
+        vwap_out[0], rsi_out[0] = _fused_vwap_rsi(high[:length], low[:length], close[:length],
+                                                  volume[:length], period)
+    
+    _GUFUNC_SIGNATURE = ['void(float64[:], float64[:], float64[:], float64[:], int64, int64, float64[:], float64[:])']
+    _GUFUNC_LAYOUT = '(n),(n),(n),(n),(),()->(),()'
+    _latest_vwap_rsi_gufunc = guvectorize(_GUFUNC_SIGNATURE, _GUFUNC_LAYOUT,
+                                          nopython=True, cache=True)(_latest_vwap_rsi_row)
+    # Same kernel with the rows spread over Numba's thread pool, for large universes
+    _latest_vwap_rsi_gufunc_parallel = guvectorize(_GUFUNC_SIGNATURE, _GUFUNC_LAYOUT, target='parallel',
+                                                   nopython=True, cache=True)(_latest_vwap_rsi_row)
+
 def calculate_vwap(df):
     """
     Calculate Volume Weighted Average Price (VWAP).
@@ -23,17 +144,19 @@ def calculate_vwap(df):
     if df.empty or 'volume' not in df.columns:
         return pd.Series(index=df.index, dtype=float)
     
+    # Work on the raw float64 columns; the pandas arithmetic layer only adds overhead here
+    bars = df[['high', 'low', 'close', 'volume']].to_numpy(dtype=np.float64)
+    volume = bars[:, 3]
+    
     # VWAP = Sum(Price * Volume) / Sum(Volume)
     # Using typical price: (High + Low + Close) / 3
-    typical_price = (df['high'] + df['low'] + df['close']) / 3
+    typical_price = (bars[:, 0] + bars[:, 1] + bars[:, 2]) / 3
     
-    # Calculate cumulative VWAP
-    cumulative_volume = df['volume'].cumsum()
-    cumulative_price_volume = (typical_price * df['volume']).cumsum()
+    # Calculate cumulative VWAP (0/0 before the first traded bar gives NaN, as before)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        vwap = np.cumsum(typical_price * volume) / np.cumsum(volume)
     
-    vwap = cumulative_price_volume / cumulative_volume
-    
-    return vwap
+    return pd.Series(vwap, index=df.index)
 
 def calculate_rsi(df, period=14):
     """
@@ -49,6 +172,10 @@ def calculate_rsi(df, period=14):
     if df.empty or 'close' not in df.columns:
         return pd.Series(index=df.index, dtype=float)
     
+    if NUMBA_AVAILABLE:
+        return pd.Series(_wilder_rsi(df['close'].to_numpy(dtype=np.float64), period),
+                         index=df.index, name='rsi')
+    
     return ta.momentum.RSIIndicator(df['close'], window=period).rsi()
 
 def calculate_all_indicators(df, rsi_period=14):
@@ -65,6 +192,12 @@ def calculate_all_indicators(df, rsi_period=14):
     if df.empty:
         return df
     
+    if NUMBA_AVAILABLE and 'volume' in df.columns:
+        # Both indicators from one pass over the bars
+        bars = df[['high', 'low', 'close', 'volume']].to_numpy(dtype=np.float64).T
+        df['vwap'], df['rsi'] = _vwap_rsi_series(bars[0], bars[1], bars[2], bars[3], rsi_period)
+        return df
+    
     # Calculate VWAP
     df['vwap'] = calculate_vwap(df)
     
@@ -86,19 +219,80 @@ def get_latest_signals(df):
     if df.empty:
         return None
     
-    latest = df.iloc[-1]
+    # Read the last element of each column directly (no row Series is built)
+    vwap = df['vwap'].to_numpy()[-1]
+    rsi = df['rsi'].to_numpy()[-1]
     
-    # Check for NaN values and provide fallback
+    # Check for NaN values and provide fallback (NaN is the only value unequal to itself)
     signals = {
-        'close': latest['close'],
-        'high': latest['high'],
-        'low': latest['low'],
-        'vwap': latest['vwap'] if pd.notna(latest['vwap']) else None,
-        'rsi': latest['rsi'] if pd.notna(latest['rsi']) else None
+        'close': df['close'].to_numpy()[-1],
+        'high': df['high'].to_numpy()[-1],
+        'low': df['low'].to_numpy()[-1],
+        'vwap': vwap if vwap == vwap else None,
+        'rsi': rsi if rsi == rsi else None
     }
     
     return signals
 
+def calculate_latest_signals_batch(frames, rsi_period=14):
+    """
+    Get the latest indicator values for several symbols in one batch.
+    
+    With Numba available, all frames are stacked into one array and VWAP/RSI
+    are computed by a single vectorized kernel call (multi-threaded from
+    PARALLEL_BATCH_MIN frames); otherwise each frame goes through
+    calculate_all_indicators and get_latest_signals.
+    
+    Args:
+        frames (list): DataFrames with OHLCV data, one per symbol
+        rsi_period (int): RSI period (default 14)
+        
+    Returns:
+        list: Latest indicator values per frame (same format as get_latest_signals)
+    """
+    if not frames:
+        return []
+    
+    if not NUMBA_AVAILABLE:
+        return [get_latest_signals(calculate_all_indicators(df, rsi_period)) for df in frames]
+    
+    # Stack into a (field, symbol, bar) array, right-padded to the longest frame
+    lengths = np.array([len(df) for df in frames], dtype=np.int64)
+    bars = np.zeros((4, len(frames), lengths.max()))
+    for i, df in enumerate(frames):
+        # Empty frames (e.g. a failed fetch) may lack the columns; their row stays padding
+        if lengths[i]:
+            bars[:, i, :lengths[i]] = df[['high', 'low', 'close', 'volume']].to_numpy(dtype=float).T
+    
+    # Below a few hundred rows, starting the worker threads costs more than they save
+    if len(frames) >= PARALLEL_BATCH_MIN:
+        # Numba's default thread pool must not be entered from two threads at once
+        with _PARALLEL_LOCK:
+            vwap, rsi = _latest_vwap_rsi_gufunc_parallel(bars[0], bars[1], bars[2], bars[3],
+                                                         lengths, rsi_period)
+    else:
+        vwap, rsi = _latest_vwap_rsi_gufunc(bars[0], bars[1], bars[2], bars[3], lengths, rsi_period)
+    
+    signals = []
+    for i, length in enumerate(lengths):
+        if length == 0:
+            signals.append(None)
+            continue
+        last = length - 1
+        latest_vwap = vwap[i]
+        latest_rsi = rsi[i]
+        signals.append({
+            'close': bars[2, i, last],
+            'high': bars[0, i, last],
+            'low': bars[1, i, last],
+            'vwap': latest_vwap if latest_vwap == latest_vwap else None,
+            'rsi': latest_rsi if latest_rsi == latest_rsi else None
+        })
+    
+    return signals
+
+_REQUIRED_COLUMNS = frozenset(('open', 'high', 'low', 'close', 'volume'))
+
 def validate_data_quality(df, min_bars=5):
     """
     Validate that we have sufficient data for VWAP calculation.
@@ -117,12 +311,11 @@ def validate_data_quality(df, min_bars=5):
         return False
     
     # Check for required columns
-    required_columns = ['open', 'high', 'low', 'close', 'volume']
-    if not all(col in df.columns for col in required_columns):
+    if not _REQUIRED_COLUMNS.issubset(df.columns):
         return False
     
-    # Check for valid volume data
-    if df['volume'].sum() == 0:
+    # Check for valid volume data (at least one traded bar; NaN counts as none)
+    if not (df['volume'].to_numpy() > 0).any():
         return False
     
     return True
@@ -6,17 +6,91 @@ Author: Trevor Hunter
 Version: 1.0
 """
 
-import pytz
-from datetime import datetime, time
-import holidays
+import json
+import os
+import tempfile
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+# Session states stored in MarketHours._session_table
+CLOSED, PREMARKET, OPEN, AFTERHOURS = range(4)
+
+# Holiday dates computed by the holidays package, cached across runs so a
+# normal start doesn't import it at all
+HOLIDAY_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "vwap_bot", "us_holidays.json")
+HOLIDAY_CACHE_YEARS_AHEAD = 5
+
+def _load_holiday_cache(path=HOLIDAY_CACHE_PATH):
+    """
+    Read cached holiday dates.
+    
+    Args:
+        path (str): Cache file path
+        
+    Returns:
+        tuple: (years, holiday dates) as frozensets, or None if the cache is missing or unreadable
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        return frozenset(cache["years"]), frozenset(map(date.fromordinal, cache["dates"]))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def _save_holiday_cache(years, holiday_dates, path=HOLIDAY_CACHE_PATH):
+    """
+    Write holiday dates to the cache (as day ordinals), replacing it atomically.
+    
+    Args:
+        years (frozenset): Years the dates cover
+        holiday_dates (frozenset): Holiday dates in those years
+        path (str): Cache file path
+    """
+    try:
+        cache_dir = os.path.dirname(path)
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"years": sorted(years),
+                           "dates": sorted(d.toordinal() for d in holiday_dates)}, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except Exception as e:
+        print(f"Warning: Could not write holiday cache: {e}")
 
 class MarketHours:
     """Handles market hours detection and trading schedule."""
     
+    # The scheduler and status refreshes read the timezone, session times and
+    # holiday sets on every check; slots keep those reads off a dict lookup
+    __slots__ = (
+        "market_tz", "_holiday_calendar",
+        "_holiday_years", "_holiday_dates", "_trading_days",
+        "market_open", "market_close", "premarket_open", "afterhours_close",
+        "_session_table",
+    )
+    
     def __init__(self):
         """Initialize market hours with US market timezone."""
-        self.market_tz = pytz.timezone('US/Eastern')
-        self.us_holidays = holidays.US()
+        self.market_tz = ZoneInfo('US/Eastern')
+        self._holiday_calendar = None  # holidays.US, see _holiday_rules
+        
+        # Holiday and trading dates as plain frozensets, covering at least the
+        # current year ± 1 and extended one year at a time when a date falls outside
+        year = datetime.now(self.market_tz).year
+        self._holiday_years = frozenset()
+        self._holiday_dates = frozenset()
+        self._trading_days = frozenset()
+        
+        cached = _load_holiday_cache()
+        if cached is None or not {year - 1, year + 1} <= cached[0]:
+            years = frozenset(range(year - 1, year + HOLIDAY_CACHE_YEARS_AHEAD + 1))
+            cached = (years, frozenset(self._holiday_rules()(years=years)))
+            _save_holiday_cache(*cached)
+        self._add_years(*cached)
         
         # Market hours (Eastern Time)
         self.market_open = time(9, 30)  # 9:30 AM ET
@@ -25,6 +99,117 @@ class MarketHours:
         # Pre-market and after-hours (optional)
         self.premarket_open = time(4, 0)   # 4:00 AM ET
         self.afterhours_close = time(20, 0)  # 8:00 PM ET
+        
+        # One byte per (minute of day, past the top of the minute) pair. Every
+        # boundary falls on a whole minute, so each half-open slot has a single
+        # state, and the inclusive 16:00:00 / 20:00:00 edges keep their own slot
+        table = bytearray()
+        for minute in range(1440):
+            for past_top in (False, True):
+                t = time(minute // 60, minute % 60, 1 if past_top else 0)
+                table.append(OPEN if self.market_open <= t <= self.market_close
+                             else PREMARKET if self.premarket_open <= t < self.market_open
+                             else AFTERHOURS if self.market_close < t <= self.afterhours_close
+                             else CLOSED)
+        self._session_table = bytes(table)
+    
+    def _holiday_rules(self):
+        """The holidays.US class, imported on first use (the package is slow to import)."""
+        if self._holiday_calendar is None:
+            import holidays
+            self._holiday_calendar = holidays.US
+        return self._holiday_calendar
+    
+    @property
+    def us_holidays(self):
+        """holidays.US calendar (imports the holidays package)."""
+        return self._holiday_rules()()
+    
+    def _add_years(self, years, holiday_dates):
+        """
+        Add years of holidays and trading days to the lookup sets.
+        
+        Args:
+            years (frozenset): Calendar years to add
+            holiday_dates (frozenset): Holiday dates in those years
+        """
+        trading_days = []
+        for year in years:
+            first = date(year, 1, 1)
+            trading_days.extend(
+                d for d in (first + timedelta(days=i)
+                            for i in range((date(year + 1, 1, 1) - first).days))
+                if d.weekday() < 5 and d not in holiday_dates)
+        self._holiday_years = self._holiday_years | years
+        self._holiday_dates = self._holiday_dates | holiday_dates
+        self._trading_days = self._trading_days | frozenset(trading_days)
+    
+    def _extend_calendar(self, year):
+        """
+        Add a year's holidays and trading days to the lookup sets.
+        
+        Args:
+            year (int): Calendar year to add
+        """
+        self._add_years(frozenset((year,)), frozenset(self._holiday_rules()(years=year)))
+    
+    def is_holiday(self, day):
+        """
+        Check if a date is a US market holiday.
+        
+        Args:
+            day (date): Date to check (Eastern Time)
+            
+        Returns:
+            bool: True if the market is closed for a holiday
+        """
+        if day.year not in self._holiday_years:
+            self._extend_calendar(day.year)
+        return day in self._holiday_dates
+    
+    def is_trading_day(self, day):
+        """
+        Check if the market trades on a date (a weekday that isn't a holiday).
+        
+        Args:
+            day (date): Date to check (Eastern Time)
+            
+        Returns:
+            bool: True if the market has a session that day
+        """
+        if day.year not in self._holiday_years:
+            self._extend_calendar(day.year)
+        return day in self._trading_days
+    
+    def session_state(self, current_time):
+        """
+        Look up the session state for a time of day, ignoring the calendar.
+        
+        Args:
+            current_time (time): Eastern Time of day
+            
+        Returns:
+            int: CLOSED, PREMARKET, OPEN or AFTERHOURS
+        """
+        return self._session_table[(current_time.hour * 60 + current_time.minute) * 2
+                                   + (current_time.second > 0 or current_time.microsecond > 0)]
+    
+    def _to_market_time(self, check_time):
+        """
+        Convert a time to Eastern Time (None means now, naive means UTC).
+        
+        Args:
+            check_time (datetime): Time to convert, or None
+            
+        Returns:
+            datetime: Timezone-aware Eastern Time datetime
+        """
+        if check_time is None:
+            return datetime.now(self.market_tz)
+        if check_time.tzinfo is None:
+            # Assume UTC if no timezone
+            return check_time.replace(tzinfo=timezone.utc).astimezone(self.market_tz)
+        return check_time.astimezone(self.market_tz)
     
     def is_market_open(self, check_time=None):
         """
@@ -36,25 +221,9 @@ class MarketHours:
         Returns:
             bool: True if market is open, False otherwise
         """
-        if check_time is None:
-            check_time = datetime.now(self.market_tz)
-        elif check_time.tzinfo is None:
-            # Assume UTC if no timezone
-            check_time = pytz.utc.localize(check_time).astimezone(self.market_tz)
-        else:
-            check_time = check_time.astimezone(self.market_tz)
-        
-        # Check if it's a weekday (Monday = 0, Sunday = 6)
-        if check_time.weekday() >= 5:  # Saturday or Sunday
-            return False
-        
-        # Check if it's a US holiday
-        if check_time.date() in self.us_holidays:
-            return False
-        
-        # Check if it's within market hours
-        current_time = check_time.time()
-        return self.market_open <= current_time <= self.market_close
+        check_time = self._to_market_time(check_time)
+        return (self.session_state(check_time.time()) == OPEN
+                and self.is_trading_day(check_time.date()))
     
     def is_premarket(self, check_time=None):
         """
@@ -66,23 +235,9 @@ class MarketHours:
         Returns:
             bool: True if pre-market hours, False otherwise
         """
-        if check_time is None:
-            check_time = datetime.now(self.market_tz)
-        elif check_time.tzinfo is None:
-            check_time = pytz.utc.localize(check_time).astimezone(self.market_tz)
-        else:
-            check_time = check_time.astimezone(self.market_tz)
-        
-        # Check if it's a weekday
-        if check_time.weekday() >= 5:
-            return False
-        
-        # Check if it's a US holiday
-        if check_time.date() in self.us_holidays:
-            return False
-        
-        current_time = check_time.time()
-        return self.premarket_open <= current_time < self.market_open
+        check_time = self._to_market_time(check_time)
+        return (self.session_state(check_time.time()) == PREMARKET
+                and self.is_trading_day(check_time.date()))
     
     def is_afterhours(self, check_time=None):
         """
@@ -94,23 +249,9 @@ class MarketHours:
         Returns:
             bool: True if after-hours, False otherwise
         """
-        if check_time is None:
-            check_time = datetime.now(self.market_tz)
-        elif check_time.tzinfo is None:
-            check_time = pytz.utc.localize(check_time).astimezone(self.market_tz)
-        else:
-            check_time = check_time.astimezone(self.market_tz)
-        
-        # Check if it's a weekday
-        if check_time.weekday() >= 5:
-            return False
-        
-        # Check if it's a US holiday
-        if check_time.date() in self.us_holidays:
-            return False
-        
-        current_time = check_time.time()
-        return self.market_close < current_time <= self.afterhours_close
+        check_time = self._to_market_time(check_time)
+        return (self.session_state(check_time.time()) == AFTERHOURS
+                and self.is_trading_day(check_time.date()))
     
     def get_market_status(self, check_time=None):
         """
@@ -122,19 +263,20 @@ class MarketHours:
         Returns:
             dict: Market status information
         """
-        if check_time is None:
-            check_time = datetime.now(self.market_tz)
-        elif check_time.tzinfo is None:
-            check_time = pytz.utc.localize(check_time).astimezone(self.market_tz)
-        else:
-            check_time = check_time.astimezone(self.market_tz)
+        check_time = self._to_market_time(check_time)
+        
+        # Decompose once and evaluate every predicate on the same fields
+        today = check_time.date()
+        is_weekend = today.weekday() >= 5
+        is_holiday = self.is_holiday(today)
+        state = CLOSED if is_weekend or is_holiday else self.session_state(check_time.time())
         
         status = {
-            'is_open': self.is_market_open(check_time),
-            'is_premarket': self.is_premarket(check_time),
-            'is_afterhours': self.is_afterhours(check_time),
-            'is_weekend': check_time.weekday() >= 5,
-            'is_holiday': check_time.date() in self.us_holidays,
+            'is_open': state == OPEN,
+            'is_premarket': state == PREMARKET,
+            'is_afterhours': state == AFTERHOURS,
+            'is_weekend': is_weekend,
+            'is_holiday': is_holiday,
             'current_time': check_time,
             'market_open': check_time.replace(hour=9, minute=30, second=0, microsecond=0),
             'market_close': check_time.replace(hour=16, minute=0, second=0, microsecond=0)
@@ -166,25 +308,47 @@ class MarketHours:
         Returns:
             datetime: Next market open time
         """
-        if check_time is None:
-            check_time = datetime.now(self.market_tz)
-        elif check_time.tzinfo is None:
-            check_time = pytz.utc.localize(check_time).astimezone(self.market_tz)
-        else:
-            check_time = check_time.astimezone(self.market_tz)
+        check_time = self._to_market_time(check_time)
         
         # Start from today
-        next_open = check_time.replace(hour=9, minute=30, second=0, microsecond=0)
+        day = check_time.date()
+        current_time = check_time.time()
         
         # If market is already open today, or it's past market close, go to next day
-        if check_time.time() >= self.market_close or self.is_market_open(check_time):
-            next_open = next_open.replace(day=next_open.day + 1)
+        if current_time >= self.market_close or (current_time >= self.market_open
+                                                 and self.is_trading_day(day)):
+            day += timedelta(days=1)
         
-        # Skip weekends and holidays
-        while next_open.weekday() >= 5 or next_open.date() in self.us_holidays:
-            next_open = next_open.replace(day=next_open.day + 1)
+        # Skip weekends and holidays (date arithmetic, so month ends roll over)
+        while not self.is_trading_day(day):
+            day += timedelta(days=1)
         
-        return next_open
+        # zoneinfo resolves the offset for the target date, so it is right across DST changes
+        return datetime.combine(day, self.market_open, tzinfo=self.market_tz)
+    
+    def get_next_transition(self, check_time=None):
+        """
+        Get the next time the market status can change
+        (pre-market start, open, close or after-hours end).
+        
+        Args:
+            check_time (datetime): Time to check from (defaults to now)
+            
+        Returns:
+            datetime: Next status boundary after check_time
+        """
+        check_time = self._to_market_time(check_time)
+        
+        for boundary in (self.premarket_open, self.market_open, self.market_close, self.afterhours_close):
+            transition = check_time.replace(hour=boundary.hour, minute=boundary.minute,
+                                            second=0, microsecond=0)
+            if transition > check_time:
+                return transition
+        
+        # Past after-hours: next is tomorrow's pre-market start
+        tomorrow = check_time + timedelta(days=1)
+        return tomorrow.replace(hour=self.premarket_open.hour, minute=self.premarket_open.minute,
+                                second=0, microsecond=0)
     
     def get_time_until_market_open(self, check_time=None):
         """
@@ -196,28 +360,42 @@ class MarketHours:
         Returns:
             timedelta: Time until market opens
         """
-        if check_time is None:
-            check_time = datetime.now(self.market_tz)
-        elif check_time.tzinfo is None:
-            check_time = pytz.utc.localize(check_time).astimezone(self.market_tz)
-        else:
-            check_time = check_time.astimezone(self.market_tz)
+        check_time = self._to_market_time(check_time)
         
         next_open = self.get_next_market_open(check_time)
-        return next_open - check_time
+        # Subtract in UTC: aware datetimes sharing one zoneinfo tzinfo subtract as
+        # wall-clock times, which is an hour off across a DST change
+        return next_open.astimezone(timezone.utc) - check_time
+
+# Shared instance, created on first use
+_instance = None
 
-# Global instance
-market_hours = MarketHours()
+def get_market_hours():
+    """Get the shared MarketHours instance, creating it on the first call."""
+    global _instance
+    if _instance is None:
+        _instance = MarketHours()
+    return _instance
+
+def __getattr__(name):
+    """Keep `market_hours.market_hours` working without building it at import time."""
+    if name == 'market_hours':
+        return get_market_hours()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Convenience functions for direct import
 def get_market_status(check_time=None):
-    """Get market status using the global instance."""
-    return market_hours.get_market_status(check_time)
+    """Get market status using the shared instance."""
+    return get_market_hours().get_market_status(check_time)
 
 def get_next_market_open(check_time=None):
-    """Get next market open time using the global instance."""
-    return market_hours.get_next_market_open(check_time)
+    """Get next market open time using the shared instance."""
+    return get_market_hours().get_next_market_open(check_time)
+
+def get_next_transition(check_time=None):
+    """Get the next market status boundary using the shared instance."""
+    return get_market_hours().get_next_transition(check_time)
 
 def is_market_open(check_time=None):
-    """Check if market is open using the global instance."""
-    return market_hours.is_market_open(check_time)
+    """Check if market is open using the shared instance."""
+    return get_market_hours().is_market_open(check_time)
@@ -6,11 +6,62 @@ Author: Trevor Hunter
 Version: 1.0
 """
 
+import hashlib
 import json
+import mmap
 import os
+import pickle
+import tempfile
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
+# orjson parses legacy JSON profiles several times faster; stdlib json is the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+PROFILE_EXT = ".pkl"
+LEGACY_PROFILE_EXT = ".json"  # Profiles written before the switch to pickle
+MMAP_MIN_SIZE = 16 * 1024  # Below this, a plain read is cheaper than setting up a mapping
+
+def _read_json(path: str) -> Any:
+    """
+    Parse a JSON file, using orjson when it is installed.
+    
+    With orjson, large files are memory-mapped and parsed in place instead
+    of being copied into a bytes object first.
+    
+    Args:
+        path (str): Path to the JSON file
+        
+    Returns:
+        The decoded JSON value
+    """
+    with open(path, 'rb') as f:
+        if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # The view must be released before the mapping can close
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        raw = f.read()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+class _ProfileUnpickler(pickle.Unpickler):
+    """
+    Unpickler restricted to built-in containers and scalars.
+    
+    Profiles are plain dicts of strings, numbers and lists, which pickle
+    without any globals, so refusing every global keeps an imported or
+    tampered profile file from running code on load.
+    """
+    
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"global '{module}.{name}' is not allowed in a profile")
+
 class ProfileManager:
     """Manages user profiles for the trading bot."""
     
@@ -24,6 +75,9 @@ class ProfileManager:
         self.profiles_dir = profiles_dir
         self.current_profile = "default"
         self.profile_data = {}
+        self._profile_cache = {}  # profile name -> (file mtime, data section)
+        self._list_cache = None  # (profiles dir mtime, profile names), see list_profiles
+        self._last_saved = {}  # profile name -> (file mtime, digest of the saved data section)
         
         # Create profiles directory if it doesn't exist
         if not os.path.exists(self.profiles_dir):
@@ -34,7 +88,11 @@ class ProfileManager:
     
     def get_profile_path(self, profile_name: str) -> str:
         """Get the file path for a profile."""
-        return os.path.join(self.profiles_dir, f"{profile_name}.json")
+        return os.path.join(self.profiles_dir, f"{profile_name}{PROFILE_EXT}")
+    
+    def get_legacy_profile_path(self, profile_name: str) -> str:
+        """Get the file path of a profile saved in the old JSON format."""
+        return os.path.join(self.profiles_dir, f"{profile_name}{LEGACY_PROFILE_EXT}")
     
     def save_profile(self, profile_name: str, data: Dict[str, Any]) -> bool:
         """
@@ -50,17 +108,43 @@ class ProfileManager:
         try:
             profile_path = self.get_profile_path(profile_name)
             
-            # Add metadata
+            # Skip the write when the data is unchanged since this manager last
+            # saved it and the file hasn't been touched since (e.g. periodic autosaves)
+            digest = hashlib.blake2b(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL),
+                                     digest_size=8).digest()
+            last = self._last_saved.get(profile_name)
+            if last is not None and last[1] == digest:
+                try:
+                    if os.stat(profile_path).st_mtime_ns == last[0]:
+                        return True
+                except OSError:
+                    pass
+            
+            # Add metadata (one clock read for both timestamps)
+            now = datetime.now().isoformat()
             profile_data = {
                 "name": profile_name,
-                "created": data.get("created", datetime.now().isoformat()),
-                "last_modified": datetime.now().isoformat(),
+                "created": data.get("created", now),
+                "last_modified": now,
                 "version": "1.0",
                 "data": data
             }
             
-            with open(profile_path, 'w', encoding='utf-8') as f:
-                json.dump(profile_data, f, indent=2, ensure_ascii=False)
+            # Write a temp file in the same directory and swap it in, so a crash
+            # mid-save never leaves a truncated profile behind
+            fd, tmp_path = tempfile.mkstemp(dir=self.profiles_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(profile_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, profile_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            self._profile_cache.pop(profile_name, None)
+            self._list_cache = None
+            self._last_saved[profile_name] = (os.stat(profile_path).st_mtime_ns, digest)
             
             return True
             
@@ -81,15 +165,35 @@ class ProfileManager:
         try:
             profile_path = self.get_profile_path(profile_name)
             
-            if not os.path.exists(profile_path):
+            # The stat doubles as the existence check; a changed mtime means the
+            # file was rewritten (possibly by another process) since it was cached
+            try:
+                mtime = os.stat(profile_path).st_mtime_ns
+            except FileNotFoundError:
+                mtime = None
+            
+            if mtime is None:
+                # One-time migration of a profile still stored as JSON
+                legacy_path = self.get_legacy_profile_path(profile_name)
+                if os.path.exists(legacy_path):
+                    data = _read_json(legacy_path).get("data", {})
+                    self.save_profile(profile_name, data)
+                    return data
+                
                 # Return None if profile doesn't exist (don't auto-create)
                 return None
             
-            with open(profile_path, 'r', encoding='utf-8') as f:
-                profile_data = json.load(f)
+            cached = self._profile_cache.get(profile_name)
+            if cached is not None and cached[0] == mtime:
+                return dict(cached[1])
             
-            # Return the data section
-            return profile_data.get("data", {})
+            with open(profile_path, 'rb') as f:
+                profile_data = _ProfileUnpickler(f).load()
+            
+            # Return the data section (a copy, so callers can't alter the cache)
+            data = profile_data.get("data", {})
+            self._profile_cache[profile_name] = (mtime, data)
+            return dict(data)
             
         except Exception as e:
             print(f"Error loading profile {profile_name}: {e}")
@@ -112,17 +216,35 @@ class ProfileManager:
         }
     
     def list_profiles(self) -> List[str]:
-        """Get list of available profiles."""
-        profiles = []
+        """
+        Get list of available profiles.
+        
+        The listing is cached until the profiles directory's mtime changes
+        (so files added by another process are seen) or this manager writes
+        or removes a profile.
+        """
+        try:
+            mtime = os.stat(self.profiles_dir).st_mtime_ns
+        except OSError:
+            mtime = None
+        if self._list_cache is not None and self._list_cache[0] == mtime:
+            return list(self._list_cache[1])
+        
+        profiles = set()
         try:
-            for filename in os.listdir(self.profiles_dir):
-                if filename.endswith('.json'):
-                    profile_name = filename[:-5]  # Remove .json extension
-                    profiles.append(profile_name)
+            # scandir's entries carry the file type, so skipping directories costs no extra stat
+            with os.scandir(self.profiles_dir) as entries:
+                for entry in entries:
+                    profile_name, ext = os.path.splitext(entry.name)
+                    if ext in (PROFILE_EXT, LEGACY_PROFILE_EXT) and entry.is_file():
+                        profiles.add(profile_name)
         except Exception as e:
             print(f"Error listing profiles: {e}")
+            return sorted(profiles)
         
-        return sorted(profiles)
+        names = sorted(profiles)
+        self._list_cache = (mtime, names)
+        return list(names)
     
     def delete_profile(self, profile_name: str) -> bool:
         """
@@ -134,12 +256,18 @@ class ProfileManager:
         Returns:
             bool: True if successful, False otherwise
         """
+        self._profile_cache.pop(profile_name, None)
+        self._last_saved.pop(profile_name, None)
+        self._list_cache = None
         try:
-            profile_path = self.get_profile_path(profile_name)
-            if os.path.exists(profile_path):
-                os.remove(profile_path)
-                return True
-            return False
+            deleted = False
+            # Also remove a not-yet-migrated JSON copy so the profile doesn't reappear
+            for profile_path in (self.get_profile_path(profile_name),
+                                 self.get_legacy_profile_path(profile_name)):
+                if os.path.exists(profile_path):
+                    os.remove(profile_path)
+                    deleted = True
+            return deleted
         except Exception as e:
             print(f"Error deleting profile {profile_name}: {e}")
             return False
@@ -157,6 +285,8 @@ class ProfileManager:
         """
         try:
             profile_path = self.get_profile_path(profile_name)
+            if not os.path.exists(profile_path):
+                profile_path = self.get_legacy_profile_path(profile_name)
             if os.path.exists(profile_path):
                 import shutil
                 shutil.copy2(profile_path, export_path)
@@ -184,9 +314,16 @@ class ProfileManager:
             if profile_name is None:
                 profile_name = os.path.splitext(os.path.basename(import_path))[0]
             
+            if import_path.endswith(LEGACY_PROFILE_EXT):
+                # JSON profile exports are converted on import
+                return self.save_profile(profile_name, _read_json(import_path).get("data", {}))
+            
             profile_path = self.get_profile_path(profile_name)
             import shutil
             shutil.copy2(import_path, profile_path)
+            self._profile_cache.pop(profile_name, None)
+            self._last_saved.pop(profile_name, None)
+            self._list_cache = None
             return True
             
         except Exception as e:
@@ -12,7 +12,15 @@ Version: 1.0
 
 import pandas as pd
 import numpy as np
-from typing import Dict, Optional
+from typing import Dict, NamedTuple, Optional
+from config import (VWAP_BUY_THRESHOLD, VWAP_SELL_THRESHOLD, RSI_OVERBOUGHT,
+                    RSI_PERIOD, VWAP_SAFETY_THRESHOLD)
+
+class PreviousSignal(NamedTuple):
+    """Last evaluated candle for a symbol, kept in previous_signals."""
+    price: float
+    vwap: float
+    signal: str  # 'buy', 'sell' or 'hold'
 
 class VWAPReversionStrategy:
     """
@@ -22,8 +30,15 @@ class VWAPReversionStrategy:
     perfect for capturing short-term price overreactions.
     """
     
-    def __init__(self, vwap_threshold_buy=0.99, vwap_threshold_sell=1.01, 
-                 rsi_overbought=70, rsi_period=14):
+    # get_buy_signal/get_sell_signal read the thresholds for every symbol on every
+    # tick, so they live in fixed slots rather than an instance dict
+    __slots__ = (
+        "vwap_threshold_buy", "vwap_threshold_sell", "rsi_overbought", "rsi_period",
+        "previous_signals", "_info_cache",
+    )
+    
+    def __init__(self, vwap_threshold_buy=VWAP_BUY_THRESHOLD, vwap_threshold_sell=VWAP_SELL_THRESHOLD, 
+                 rsi_overbought=RSI_OVERBOUGHT, rsi_period=RSI_PERIOD):
         """
         Initialize the VWAP Reversion strategy.
         
@@ -39,7 +54,10 @@ class VWAPReversionStrategy:
         self.rsi_period = rsi_period
         
         # Track previous candle for "closes above VWAP again" condition
-        self.previous_signals = {}
+        self.previous_signals = {}  # symbol -> PreviousSignal
+        
+        # get_strategy_info result, rebuilt after update_parameters
+        self._info_cache = None
     
     def get_buy_signal(self, signals, symbol):
         """
@@ -59,33 +77,26 @@ class VWAPReversionStrategy:
         if not signals:
             return False
         
+        # Read each value once; the checks below work on locals
+        current_price = signals.get('close')
+        vwap = signals.get('vwap')
+        
         # Check if we have required data
-        if (signals['close'] is None or signals['vwap'] is None or 
-            signals['high'] is None or signals['low'] is None):
+        if (current_price is None or vwap is None or
+                signals.get('high') is None or signals.get('low') is None):
             return False
         
-        current_price = signals['close']
-        vwap = signals['vwap']
-        
-        # Condition 1: Price < VWAP × 0.99 (price is below VWAP threshold)
-        price_below_threshold = current_price < (vwap * self.vwap_threshold_buy)
-        
-        # Condition 2: Current candle closes above VWAP (reversion signal)
-        candle_closes_above_vwap = current_price > vwap
-        
-        # Additional safety: Ensure we're not too far below VWAP (avoid falling knives)
-        price_not_too_low = current_price > (vwap * 0.95)  # Within 5% of VWAP
-        
-        buy_signal = (price_below_threshold and 
-                     candle_closes_above_vwap and 
-                     price_not_too_low)
+        # Short-circuits in order of how often each condition fails:
+        # 1. Price < VWAP × 0.99 (price is below VWAP threshold)
+        # 2. Current candle closes above VWAP (reversion signal)
+        # 3. Safety: not too far below VWAP, within 5% (avoid falling knives)
+        buy_signal = (current_price < vwap * self.vwap_threshold_buy and
+                      current_price > vwap and
+                      current_price > vwap * VWAP_SAFETY_THRESHOLD)
         
         # Store signal for next iteration
-        self.previous_signals[symbol] = {
-            'price': current_price,
-            'vwap': vwap,
-            'signal': 'buy' if buy_signal else 'hold'
-        }
+        self.previous_signals[symbol] = PreviousSignal(current_price, vwap,
+                                                       'buy' if buy_signal else 'hold')
         
         return buy_signal
     
@@ -107,37 +118,126 @@ class VWAPReversionStrategy:
         if not signals:
             return False
         
+        # Read each value once; the checks below work on locals
+        current_price = signals.get('close')
+        vwap = signals.get('vwap')
+        rsi = signals.get('rsi')
+        
         # Check if we have required data
-        if (signals['close'] is None or signals['vwap'] is None or 
-            signals['rsi'] is None):
+        if current_price is None or vwap is None or rsi is None:
             return False
         
-        current_price = signals['close']
-        vwap = signals['vwap']
-        rsi = signals['rsi']
+        # Either condition sells; the RSI compare needs no multiply, so it goes first:
+        # 1. RSI > 70 (overbought condition)
+        # 2. Price > VWAP × 1.01 (price is above VWAP threshold)
+        sell_signal = (rsi > self.rsi_overbought or
+                       current_price > vwap * self.vwap_threshold_sell)
         
-        # Condition 1: Price > VWAP × 1.01 (price is above VWAP threshold)
-        price_above_threshold = current_price > (vwap * self.vwap_threshold_sell)
+        # Store signal for next iteration
+        previous = self.previous_signals.get(symbol)
+        if previous is not None:
+            self.previous_signals[symbol] = previous._replace(signal='sell' if sell_signal else 'hold')
         
-        # Condition 2: RSI > 70 (overbought condition)
-        rsi_overbought = rsi > self.rsi_overbought
+        return sell_signal
+    
+    def _signal_masks(self, close, vwap, rsi):
+        """
+        Buy and sell conditions of get_buy_signal / get_sell_signal, elementwise.
         
-        sell_signal = price_above_threshold or rsi_overbought
+        Args:
+            close (np.ndarray): Close prices
+            vwap (np.ndarray): VWAP values (NaN where unavailable)
+            rsi (np.ndarray): RSI values (NaN where unavailable)
+            
+        Returns:
+            tuple: (buy, sell) boolean arrays; missing inputs give False
+        """
+        # Comparisons with NaN are False, so missing values never signal
+        buy = ((close < vwap * self.vwap_threshold_buy) & (close > vwap)
+               & (close > vwap * VWAP_SAFETY_THRESHOLD))
+        has_sell_data = ~(np.isnan(close) | np.isnan(vwap) | np.isnan(rsi))
+        sell = has_sell_data & ((close > vwap * self.vwap_threshold_sell)
+                                | (rsi > self.rsi_overbought))
+        return buy, sell
+    
+    def compute_signals(self, df):
+        """
+        Evaluate the buy and sell conditions on every bar of a DataFrame.
         
-        # Store signal for next iteration
-        if symbol in self.previous_signals:
-            self.previous_signals[symbol]['signal'] = 'sell' if sell_signal else 'hold'
+        The vectorized counterpart of get_buy_signal / get_sell_signal for
+        backtests; previous_signals is not touched.
         
-        return sell_signal
+        Args:
+            df (pd.DataFrame): Bars with close, vwap and rsi columns
+                (see indicators.calculate_all_indicators)
+            
+        Returns:
+            pd.DataFrame: Boolean 'buy' and 'sell' columns on df's index
+        """
+        buy, sell = self._signal_masks(df['close'].to_numpy(dtype=np.float64),
+                                       df['vwap'].to_numpy(dtype=np.float64),
+                                       df['rsi'].to_numpy(dtype=np.float64))
+        return pd.DataFrame({'buy': buy, 'sell': sell}, index=df.index)
+    
+    def get_signals_batch(self, symbols, signals_list):
+        """
+        Evaluate the buy and sell conditions for many symbols at once.
+        
+        Gives the same result, and leaves previous_signals in the same state,
+        as calling get_buy_signal and then (if it is False) get_sell_signal
+        for each symbol, but the conditions are computed as NumPy array
+        expressions over all symbols.
+        
+        Args:
+            symbols (list): Stock symbols
+            signals_list (list): Latest indicator values per symbol (None if unavailable)
+            
+        Returns:
+            list: 'buy', 'sell' or 'hold' per symbol
+        """
+        if not symbols:
+            return []
+        
+        # None becomes NaN, which fails every comparison below
+        values = np.array([(s['close'], s['vwap'], s['rsi'], s['high'], s['low']) if s
+                           else (None,) * 5 for s in signals_list], dtype=np.float64)
+        close, vwap, rsi, high, low = values.T
+        
+        has_buy_data = ~np.isnan(values[:, [0, 1, 3, 4]]).any(axis=1)
+        buy, sell = self._signal_masks(close, vwap, rsi)
+        buy &= has_buy_data
+        sell &= ~buy
+        
+        decisions = np.where(buy, 'buy', np.where(sell, 'sell', 'hold')).tolist()
+        
+        # Same bookkeeping as get_buy_signal, which stores a fresh entry from the
+        # original values, then get_sell_signal, which only relabels an existing one
+        has_sell_data = ~np.isnan(values[:, :3]).any(axis=1)
+        previous_signals = self.previous_signals
+        for i in np.flatnonzero(has_buy_data | has_sell_data):
+            symbol = symbols[i]
+            if has_buy_data[i]:
+                latest = signals_list[i]
+                previous_signals[symbol] = PreviousSignal(latest['close'], latest['vwap'],
+                                                          decisions[i])
+            else:
+                previous = previous_signals.get(symbol)
+                if previous is not None:
+                    previous_signals[symbol] = previous._replace(signal=decisions[i])
+        
+        return decisions
     
     def get_strategy_info(self):
         """
         Get strategy information and parameters.
         
         Returns:
-            dict: Strategy information
+            dict: Strategy information (shared; don't modify)
         """
-        return {
+        if self._info_cache is not None:
+            return self._info_cache
+        
+        self._info_cache = {
             'name': 'VWAP Reversion Strategy',
             'description': 'Intraday mean reversion around VWAP with RSI confirmation',
             'parameters': {
@@ -156,6 +256,7 @@ class VWAPReversionStrategy:
                 f'RSI > {self.rsi_overbought}'
             ]
         }
+        return self._info_cache
     
     def update_parameters(self, **kwargs):
         """
@@ -164,6 +265,7 @@ class VWAPReversionStrategy:
         Args:
             **kwargs: Strategy parameters to update
         """
+        self._info_cache = None
         if 'vwap_threshold_buy' in kwargs:
             self.vwap_threshold_buy = kwargs['vwap_threshold_buy']
         if 'vwap_threshold_sell' in kwargs:
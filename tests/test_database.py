@@ -0,0 +1,69 @@
+"""
+Tests for how TradeDatabase stores timestamps.
+"""
+
+import time
+from datetime import datetime, timezone
+
+import pandas as pd
+import pytest
+
+import database
+from database import TradeDatabase, format_timestamp
+
+
+@pytest.fixture
+def local_tz(monkeypatch):
+    """Run in a fixed non-UTC local timezone so conversions are observable."""
+    if not hasattr(time, 'tzset'):
+        pytest.skip("time.tzset is not available")
+    monkeypatch.setenv('TZ', 'America/New_York')
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.fixture
+def db(tmp_path):
+    trade_db = TradeDatabase(str(tmp_path / 'trades.db'))
+    yield trade_db
+    trade_db.close()
+
+
+def _stored_timestamps(trade_db):
+    return [row[0] for row in trade_db._write_conn.execute(
+        'SELECT timestamp FROM trades ORDER BY id')]
+
+
+def test_format_timestamp_matches_timestamp_format():
+    when = datetime(2025, 1, 2, 3, 4, 5)
+    assert format_timestamp(when) == when.strftime(database.TIMESTAMP_FORMAT)
+    assert format_timestamp(when) == '2025-01-02T03:04:05.000000'
+
+
+def test_aware_times_are_stored_in_local_time(local_tz):
+    utc = datetime(2025, 7, 1, 16, 0, 0, 123456, tzinfo=timezone.utc)
+    assert format_timestamp(utc) == '2025-07-01T12:00:00.123456'
+    assert format_timestamp(pd.Timestamp(utc)) == '2025-07-01T12:00:00.123456'
+
+
+def test_malformed_string_timestamps_are_rejected():
+    with pytest.raises(ValueError):
+        format_timestamp('2025-07-01 12:00:00')
+
+
+def test_every_write_path_uses_one_format(db, local_tz):
+    db.log_trade('AAA', 'buy', 1.0, 1, 'filled', 'o1', 0.9, 1.1, 'test')
+    db.log_trades_many([(datetime(2025, 7, 1, 12), 'BBB', 'buy', 1.0, 1, 'filled',
+                         'o2', None, None, None)])
+    db.log_trades_df(pd.DataFrame({
+        'timestamp': pd.to_datetime(['2025-07-01 16:00', '2025-07-01 17:00'], utc=True),
+        'symbol': ['CCC', 'DDD'], 'side': ['sell', 'sell'], 'price': [2.0, 3.0],
+        'qty': [1, 1], 'status': ['filled', 'filled'],
+    }))
+
+    stamps = _stored_timestamps(db)
+    assert all(database._is_timestamp(stamp) for stamp in stamps)
+    assert stamps[1:] == ['2025-07-01T12:00:00.000000', '2025-07-01T12:00:00.000000',
+                          '2025-07-01T13:00:00.000000']
@@ -0,0 +1,55 @@
+"""
+Tests for calculate_latest_signals_batch.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import indicators
+from indicators import calculate_all_indicators, calculate_latest_signals_batch, get_latest_signals
+
+
+def _ohlcv(n, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.standard_normal(n).cumsum()
+    return pd.DataFrame({
+        'open': close + rng.uniform(-0.5, 0.5, n),
+        'high': close + rng.uniform(0, 1, n),
+        'low': close - rng.uniform(0, 1, n),
+        'close': close,
+        'volume': rng.uniform(1e3, 1e4, n),
+    })
+
+
+@pytest.fixture(params=[True, False], ids=['numba', 'pandas'])
+def numba_path(request, monkeypatch):
+    if request.param and not indicators.NUMBA_AVAILABLE:
+        pytest.skip("numba is not installed")
+    monkeypatch.setattr(indicators, 'NUMBA_AVAILABLE', request.param)
+
+
+def test_empty_frame_gives_none(numba_path):
+    df = _ohlcv(40)
+
+    signals = calculate_latest_signals_batch([pd.DataFrame(), df])
+
+    assert signals[0] is None
+    expected = get_latest_signals(calculate_all_indicators(df))
+    assert signals[1].keys() == expected.keys()
+    for key, value in expected.items():
+        assert signals[1][key] == pytest.approx(value)
+
+
+def test_matches_per_frame_signals_for_uneven_lengths(numba_path):
+    frames = [_ohlcv(n, seed=n) for n in (5, 30, 80)]
+
+    signals = calculate_latest_signals_batch(frames)
+
+    for df, batch in zip(frames, signals):
+        expected = get_latest_signals(calculate_all_indicators(df))
+        for key, value in expected.items():
+            if value is None:
+                assert batch[key] is None
+            else:
+                assert batch[key] == pytest.approx(value)
@@ -0,0 +1,71 @@
+"""
+Tests for VWAPReversionStrategy.get_signals_batch.
+"""
+
+import random
+
+from strategy import PreviousSignal, VWAPReversionStrategy
+
+
+def _random_signals(rng):
+    """Latest-signal dicts around a VWAP of 100, with some values missing."""
+    if rng.random() < 0.1:
+        return None
+    vwap = 100.0
+    close = vwap * rng.uniform(0.93, 1.03)
+    signals = {
+        'close': close,
+        'high': close + rng.uniform(0, 1),
+        'low': close - rng.uniform(0, 1),
+        'vwap': vwap,
+        'rsi': rng.uniform(20, 90),
+    }
+    for key in signals:
+        if rng.random() < 0.15:
+            signals[key] = None
+    return signals
+
+
+def _sequential(strategy, symbols, signals_list):
+    decisions = []
+    for symbol, signals in zip(symbols, signals_list):
+        if strategy.get_buy_signal(signals, symbol):
+            decisions.append('buy')
+        elif strategy.get_sell_signal(signals, symbol):
+            decisions.append('sell')
+        else:
+            decisions.append('hold')
+    return decisions
+
+
+def test_batch_matches_sequential_calls():
+    rng = random.Random(7)
+    symbols = [f"SYM{i}" for i in range(300)]
+
+    for _ in range(5):
+        # Some symbols already have an entry from an earlier candle
+        existing = {symbol: PreviousSignal(99.0, 100.0, 'hold')
+                    for symbol in symbols if rng.random() < 0.5}
+        signals_list = [_random_signals(rng) for _ in symbols]
+
+        sequential, batch = VWAPReversionStrategy(), VWAPReversionStrategy()
+        sequential.previous_signals = dict(existing)
+        batch.previous_signals = dict(existing)
+
+        assert batch.get_signals_batch(symbols, signals_list) == \
+            _sequential(sequential, symbols, signals_list)
+        assert batch.previous_signals == sequential.previous_signals
+        for symbol, entry in batch.previous_signals.items():
+            assert [type(value) for value in entry] == \
+                [type(value) for value in sequential.previous_signals[symbol]]
+
+
+def test_batch_relabels_existing_entry_without_buy_data():
+    strategy = VWAPReversionStrategy()
+    strategy.previous_signals['AAA'] = PreviousSignal(99.0, 100.0, 'buy')
+
+    decisions = strategy.get_signals_batch(
+        ['AAA'], [{'close': 105.0, 'high': None, 'low': None, 'vwap': 100.0, 'rsi': 50.0}])
+
+    assert decisions == ['sell']
+    assert strategy.previous_signals['AAA'] == PreviousSignal(99.0, 100.0, 'sell')
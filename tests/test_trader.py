@@ -0,0 +1,76 @@
+"""
+Tests for AlpacaTrader.get_historical_data_bulk.
+"""
+
+import pytest
+
+pytest.importorskip("alpaca_trade_api")
+
+from trader import AlpacaTrader
+
+
+class _Bar:
+    """Minimal stand-in for an Alpaca bar entity."""
+
+    def __init__(self, raw):
+        self._raw = raw
+
+
+class _FakeAPI:
+    """
+    Fake REST client with Alpaca's limit semantics: a multi-symbol request's
+    limit caps the total number of bars, returned symbol by symbol.
+    """
+
+    def __init__(self, bar_counts):
+        self.bars = {
+            symbol: [{'S': symbol, 't': f"2025-01-01T00:{i:04d}", 'o': i, 'h': i + 1,
+                      'l': i - 1, 'c': i + 0.5, 'v': 100 + i} for i in range(count)]
+            for symbol, count in bar_counts.items()
+        }
+        self.calls = []
+
+    def get_bars(self, symbols, timeframe, limit=None):
+        self.calls.append(symbols)
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        bars = [raw for symbol in sorted(symbols) for raw in self.bars.get(symbol, [])]
+        return [_Bar(raw) for raw in bars[:limit]]
+
+
+def _trader(bar_counts):
+    """An AlpacaTrader wired to a fake API (skips the live connection in __init__)."""
+    trader = AlpacaTrader.__new__(AlpacaTrader)
+    trader.api = _FakeAPI(bar_counts)
+    return trader
+
+
+def test_uneven_bar_counts_refetch_crowded_out_symbols():
+    # AAA alone fills the 3 x 100 budget, crowding BBB and CCC out of the response
+    trader = _trader({'AAA': 300, 'BBB': 50, 'CCC': 200})
+
+    frames = trader.get_historical_data_bulk(['AAA', 'BBB', 'CCC'], '5Min', limit=100)
+
+    assert {symbol: len(df) for symbol, df in frames.items()} == {'AAA': 100, 'BBB': 50, 'CCC': 100}
+    for symbol in ('BBB', 'CCC'):
+        assert frames[symbol].equals(trader.get_historical_data(symbol, '5Min', limit=100))
+
+
+def test_partial_frame_is_refetched_in_full():
+    # AAA uses 250 of the 300 budget, so BBB comes back truncated to 50 bars
+    trader = _trader({'AAA': 250, 'BBB': 120, 'CCC': 0})
+
+    frames = trader.get_historical_data_bulk(['AAA', 'BBB', 'CCC'], '5Min', limit=100)
+
+    assert len(frames['AAA']) == 100
+    assert len(frames['BBB']) == 100
+    assert 'CCC' not in frames  # No bars at all stays missing, not empty
+
+
+def test_no_refetch_when_budget_not_exhausted():
+    trader = _trader({'AAA': 100, 'BBB': 30})
+
+    frames = trader.get_historical_data_bulk(['AAA', 'BBB'], '5Min', limit=100)
+
+    assert {symbol: len(df) for symbol, df in frames.items()} == {'AAA': 100, 'BBB': 30}
+    assert len(trader.api.calls) == 1
@@ -8,16 +8,84 @@ Version: 1.0
 
 import time
 import logging
+from operator import itemgetter
+import numpy as np
 import pandas as pd
+from requests.adapters import HTTPAdapter
 from alpaca_trade_api import REST, TimeFrame
 from alpaca_trade_api.rest import APIError
 from config import Config
 from database import TradeDatabase
 
+# orjson decodes API responses (bars especially) several times faster than
+# requests' stdlib json; without it responses are decoded as before
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Timeframe strings accepted by get_historical_data -> Alpaca TimeFrame
+_TIMEFRAMES = {
+    '1Min': TimeFrame.Minute,
+    '5Min': TimeFrame(5, 'minute'),
+    '15Min': TimeFrame(15, 'minute'),
+    '1Hour': TimeFrame.Hour,
+    '1Day': TimeFrame.Day
+}
+
+# Kept-alive HTTPS connections to Alpaca, enough for the GUI's concurrent
+# bar fetches (requests' default pool holds 10)
+HTTP_POOL_SIZE = 32
+
+# Seconds a get_positions result is reused; orders placed through this
+# trader invalidate it immediately
+POSITIONS_CACHE_TTL = 2.0
+
+# Fields read from each raw Alpaca bar, in unpacking order
+_bar_fields = itemgetter('t', 'o', 'h', 'l', 'c', 'v')
+
+def _orjson_response_hook(resp, *args, **kwargs):
+    """
+    requests response hook: make resp.json() decode the body with orjson.
+    
+    Args:
+        resp (requests.Response): Response about to be returned to the caller
+        
+    Returns:
+        requests.Response: The same response
+    """
+    resp.json = lambda **_: orjson.loads(resp.content)
+    return resp
+
+def _bars_to_frame(raw_bars):
+    """
+    Convert raw Alpaca bar dicts to an OHLCV DataFrame indexed by timestamp.
+    
+    Args:
+        raw_bars (list): Bars as returned in the API response ('t', 'o', 'h', ...)
+        
+    Returns:
+        pd.DataFrame: Historical OHLCV data
+    """
+    if not raw_bars:
+        return pd.DataFrame()
+    
+    # Transpose the bars into one tuple per field, then cast each column in a
+    # single NumPy call instead of building a dict and calling float() per bar
+    timestamps, opens, highs, lows, closes, volumes = zip(*map(_bar_fields, raw_bars))
+    return pd.DataFrame({
+        'open': np.array(opens, dtype=np.float64),
+        'high': np.array(highs, dtype=np.float64),
+        'low': np.array(lows, dtype=np.float64),
+        'close': np.array(closes, dtype=np.float64),
+        'volume': np.array(volumes, dtype=np.int64)
+    }, index=pd.Index(timestamps, name='timestamp'))
+
 class AlpacaTrader:
     """Handles trading operations with Alpaca API."""
     
@@ -29,10 +97,24 @@ class AlpacaTrader:
             base_url=Config.BASE_URL,
             api_version='v2'
         )
+        # Every REST call goes through this one session; a larger pool lets
+        # concurrent requests reuse kept-alive connections instead of opening
+        # (and TLS-handshaking) new ones once the default 10 are in use.
+        # Retries stay with REST itself (APCA_RETRY_MAX / APCA_RETRY_CODES).
+        session = getattr(self.api, '_session', None)
+        if session is not None:
+            session.mount('https://', HTTPAdapter(pool_connections=HTTP_POOL_SIZE,
+                                                  pool_maxsize=HTTP_POOL_SIZE))
+            # REST decodes every body via resp.json(); this swaps the decoder
+            # without touching the SDK module
+            if ORJSON_AVAILABLE:
+                session.hooks['response'].append(_orjson_response_hook)
         self.db = TradeDatabase()
         self.position_size = Config.POSITION_SIZE
         self.stop_loss_pct = Config.STOP_LOSS_PCT
         self.take_profit_pct = Config.TAKE_PROFIT_PCT
+        self._bracket_multipliers = self._compute_bracket_multipliers()
+        self._positions_cache = None  # (time.monotonic() of the fetch, positions)
         
         # Test connection
         self._connected = False
@@ -72,12 +154,20 @@ class AlpacaTrader:
         """
         Get current positions.
         
+        Results are reused for POSITIONS_CACHE_TTL seconds, so the position
+        checks of back-to-back trades share one API request.
+        
         Returns:
             list: List of current positions
         """
+        cached = self._positions_cache
+        if cached is not None and time.monotonic() - cached[0] < POSITIONS_CACHE_TTL:
+            return list(cached[1])
+        
         try:
+            fetched_at = time.monotonic()
             positions = self.api.list_positions()
-            return [
+            positions = [
                 {
                     'symbol': pos.symbol,
                     'qty': float(pos.qty),
@@ -88,10 +178,16 @@ class AlpacaTrader:
                 }
                 for pos in positions
             ]
+            self._positions_cache = (fetched_at, positions)
+            return list(positions)
         except Exception as e:
             logger.error(f"Error getting positions: {e}")
             return []
     
+    def invalidate_positions(self):
+        """Drop the cached positions so the next get_positions call refetches."""
+        self._positions_cache = None
+    
     def get_historical_data(self, symbol, timeframe='1Hour', limit=200):
         """
         Get historical OHLCV data for a symbol.
@@ -105,48 +201,77 @@ class AlpacaTrader:
             pd.DataFrame: Historical OHLCV data
         """
         try:
-            # Convert timeframe string to TimeFrame object
-            tf_map = {
-                '1Min': TimeFrame.Minute,
-                '5Min': TimeFrame(5, 'minute'),
-                '15Min': TimeFrame(15, 'minute'),
-                '1Hour': TimeFrame.Hour,
-                '1Day': TimeFrame.Day
-            }
-            
-            tf = tf_map.get(timeframe, TimeFrame.Hour)
-            
             # Get historical data
             bars = self.api.get_bars(
                 symbol,
-                tf,
+                _TIMEFRAMES.get(timeframe, TimeFrame.Hour),
                 limit=limit
             )
             
-            # Convert to DataFrame
-            data = []
+            # Access the raw data from the _raw attribute
+            return _bars_to_frame([bar._raw for bar in bars])
+            
+        except Exception as e:
+            logger.error(f"Error getting historical data for {symbol}: {e}")
+            return pd.DataFrame()
+    
+    def get_historical_data_bulk(self, symbols, timeframe='1Hour', limit=200):
+        """
+        Get historical OHLCV data for several symbols with one bars request.
+        
+        The request allows limit bars per symbol in total. When the response
+        uses that whole budget, a symbol with more than limit bars may have
+        crowded out the ones after it, so every symbol that came back with
+        fewer than limit bars is refetched on its own with get_historical_data.
+        
+        Args:
+            symbols (list): Trading symbols
+            timeframe (str): Timeframe for data
+            limit (int): Number of bars to retrieve per symbol
+            
+        Returns:
+            dict: Symbol -> pd.DataFrame of historical OHLCV data (symbols
+                without bars are missing; empty if the request failed)
+        """
+        if not symbols:
+            return {}
+        
+        try:
+            bars = self.api.get_bars(
+                list(symbols),
+                _TIMEFRAMES.get(timeframe, TimeFrame.Hour),
+                limit=limit * len(symbols)
+            )
+            
+            # Multi-symbol responses tag every bar with its symbol ('S')
+            raw_by_symbol = {}
+            total = 0
             for bar in bars:
-                # Access the raw data from the _raw attribute
                 raw_data = bar._raw
-                
-                data.append({
-                    'timestamp': raw_data['t'],  # timestamp
-                    'open': float(raw_data['o']),  # open
-                    'high': float(raw_data['h']),  # high
-                    'low': float(raw_data['l']),   # low
-                    'close': float(raw_data['c']), # close
-                    'volume': int(raw_data['v'])   # volume
-                })
+                raw_by_symbol.setdefault(raw_data['S'], []).append(raw_data)
+                total += 1
             
-            df = pd.DataFrame(data)
-            if not df.empty:
-                df.set_index('timestamp', inplace=True)
-            
-            return df
+            frames = {symbol: _bars_to_frame(raw_bars[:limit])
+                      for symbol, raw_bars in raw_by_symbol.items()}
             
         except Exception as e:
-            logger.error(f"Error getting historical data for {symbol}: {e}")
-            return pd.DataFrame()
+            logger.error(f"Error getting historical data for {len(symbols)} symbols: {e}")
+            return {}
+        
+        if total >= limit * len(symbols):
+            # The cap was hit, so short (or absent) symbols may just be truncated
+            short = [symbol for symbol in symbols if len(raw_by_symbol.get(symbol, ())) < limit]
+            if short:
+                logger.info("Bulk bars request hit its cap; refetching %d symbols individually",
+                            len(short))
+            for symbol in short:
+                df = self.get_historical_data(symbol, timeframe, limit)
+                if df.empty:
+                    frames.pop(symbol, None)  # Missing rather than truncated
+                else:
+                    frames[symbol] = df
+        
+        return frames
     
     def calculate_position_size(self, price):
         """
@@ -160,6 +285,18 @@ class AlpacaTrader:
         """
         return round(self.position_size / price, 2)
     
+    def _compute_bracket_multipliers(self):
+        """
+        Price multipliers for bracket orders under the current settings.
+        
+        Returns:
+            dict: 'buy' / 'sell' -> (stop loss multiplier, take profit multiplier)
+        """
+        return {
+            'buy': (1 - self.stop_loss_pct, 1 + self.take_profit_pct),
+            'sell': (1 + self.stop_loss_pct, 1 - self.take_profit_pct)
+        }
+    
     def update_trading_settings(self, position_size=None, stop_loss_pct=None, take_profit_pct=None):
         """
         Update trading settings dynamically.
@@ -175,6 +312,7 @@ class AlpacaTrader:
             self.stop_loss_pct = stop_loss_pct
         if take_profit_pct is not None:
             self.take_profit_pct = take_profit_pct
+        self._bracket_multipliers = self._compute_bracket_multipliers()
         
         logger.info(f"Trading settings updated: Position=${self.position_size}, Stop Loss={self.stop_loss_pct*100:.1f}%, Take Profit={self.take_profit_pct*100:.1f}%")
     
@@ -194,12 +332,10 @@ class AlpacaTrader:
         """
         try:
             # Calculate stop loss and take profit prices
-            if side.lower() == 'buy':
-                stop_loss_price = current_price * (1 - self.stop_loss_pct)
-                take_profit_price = current_price * (1 + self.take_profit_pct)
-            else:  # sell
-                stop_loss_price = current_price * (1 + self.stop_loss_pct)
-                take_profit_price = current_price * (1 - self.take_profit_pct)
+            stop_loss_mul, take_profit_mul = self._bracket_multipliers[
+                'buy' if side.lower() == 'buy' else 'sell']
+            stop_loss_price = current_price * stop_loss_mul
+            take_profit_price = current_price * take_profit_mul
             
             # Place bracket order
             order = self.api.submit_order(
@@ -212,6 +348,7 @@ class AlpacaTrader:
                 stop_loss={'stop_price': stop_loss_price},
                 take_profit={'limit_price': take_profit_price}
             )
+            self.invalidate_positions()
             
             # Log the trade
             self.db.log_trade(
@@ -226,8 +363,8 @@ class AlpacaTrader:
                 reason=reason
             )
             
-            logger.info(f"✓ {side.upper()} order placed for {symbol}: {qty} shares @ ${current_price:.2f}")
-            logger.info(f"  Stop Loss: ${stop_loss_price:.2f}, Take Profit: ${take_profit_price:.2f}")
+            logger.info("✓ %s order placed for %s: %s shares @ $%.2f", side.upper(), symbol, qty, current_price)
+            logger.info("  Stop Loss: $%.2f, Take Profit: $%.2f", stop_loss_price, take_profit_price)
             
             return {
                 'order_id': order.id,
@@ -259,28 +396,34 @@ class AlpacaTrader:
             )
             return None
     
-    def close_position(self, symbol, reason=None):
+    def close_position(self, symbol, reason=None, position=None):
         """
         Close an existing position for a symbol.
         
         Args:
             symbol (str): Trading symbol
             reason (str): Reason for closing
+            position (dict): The symbol's entry from get_positions, if the caller
+                already has it (otherwise it is fetched for this symbol alone)
             
         Returns:
             bool: True if position was closed successfully
         """
         try:
-            positions = self.get_positions()
-            position = next((p for p in positions if p['symbol'] == symbol), None)
-            
-            if not position:
-                logger.info(f"No position found for {symbol}")
-                return False
+            if position is None:
+                # Single-position endpoint; it answers 404 when there is none
+                try:
+                    pos = self.api.get_position(symbol)
+                except APIError:
+                    logger.info(f"No position found for {symbol}")
+                    return False
+                position_qty = float(pos.qty)
+            else:
+                position_qty = position['qty']
             
             # Determine side to close position
-            side = 'sell' if position['side'] == 'long' else 'buy'
-            qty = abs(position['qty'])
+            side = 'sell' if position_qty > 0 else 'buy'
+            qty = abs(position_qty)
             
             # Get current price
             current_price = self.get_current_price(symbol)
@@ -296,6 +439,7 @@ class AlpacaTrader:
                 type='market',
                 time_in_force='day'
             )
+            self.invalidate_positions()
             
             # Log the trade
             self.db.log_trade(
@@ -308,7 +452,7 @@ class AlpacaTrader:
                 reason=f"Close position: {reason}"
             )
             
-            logger.info(f"✓ Position closed for {symbol}: {qty} shares @ ${current_price:.2f}")
+            logger.info("✓ Position closed for %s: %s shares @ $%.2f", symbol, qty, current_price)
             return True
             
         except Exception as e:
@@ -345,12 +489,14 @@ class AlpacaTrader:
         Returns:
             bool: True if trade was executed successfully
         """
-        if signal == 'HOLD':
+        # Only BUY and SELL act; anything else returns before any API call
+        if signal not in ('BUY', 'SELL'):
             return True
         
         # Check if we already have a position
         positions = self.get_positions()
-        has_position = any(p['symbol'] == symbol for p in positions)
+        position = next((p for p in positions if p['symbol'] == symbol), None)
+        has_position = position is not None
         
         if signal == 'BUY' and not has_position:
             # Calculate position size
@@ -359,6 +505,6 @@ class AlpacaTrader:
                 return self.place_bracket_order(symbol, 'buy', qty, current_price, reason) is not None
         
         elif signal == 'SELL' and has_position:
-            return self.close_position(symbol, reason)
+            return self.close_position(symbol, reason, position)
         
         return True
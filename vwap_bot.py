@@ -13,14 +13,14 @@ Version: 1.0
 import time
 import schedule
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Any
 
-from config import Config
+from config import Config, TIMEFRAME, RSI_PERIOD
 from trader import AlpacaTrader
 from strategy import VWAPReversionStrategy
-from indicators import calculate_all_indicators, get_latest_signals, validate_data_quality
-from database import TradeDatabase
+from indicators import calculate_latest_signals_batch, validate_data_quality
 from market_hours import get_market_status
 
 # Configure logging
@@ -35,6 +35,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent per-symbol bar requests
+MAX_FETCH_WORKERS = 16
+
 class VWAPReversionBot:
     """
     VWAP Reversion Trading Bot for intraday mean reversion trading.
@@ -60,7 +63,8 @@ class VWAPReversionBot:
             rsi_overbought=Config.RSI_OVERBOUGHT,
             rsi_period=Config.RSI_PERIOD
         )
-        self.database = TradeDatabase()
+        # Share the trader's handler so every trade log of a run lands in one batch
+        self.database = self.trader.db
         
         logger.info("VWAP Reversion Bot initialized")
         logger.info(f"Strategy: {self.strategy.get_strategy_info()['name']}")
@@ -83,37 +87,80 @@ class VWAPReversionBot:
         
         logger.info("Market is open - running strategy analysis")
         
+        # One multi-symbol bars request for the whole run
+        bars_by_symbol = self.trader.get_historical_data_bulk(self.symbols, TIMEFRAME)
+        
+        # Symbols the bulk response didn't cover (or all of them, if it failed) are
+        # fetched one by one, concurrently, since each request is mostly network wait
+        missing = [symbol for symbol in self.symbols if symbol not in bars_by_symbol]
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(missing))) as pool:
+                frames = pool.map(lambda symbol: self.trader.get_historical_data(symbol, TIMEFRAME),
+                                  missing)
+                bars_by_symbol.update(zip(missing, frames))
+        
+        ready = []
         for symbol in self.symbols:
-            try:
-                self.analyze_symbol(symbol)
-            except Exception as e:
-                logger.error(f"Error analyzing {symbol}: {e}")
-                continue
+            if validate_data_quality(bars_by_symbol[symbol], min_bars=5):
+                ready.append(symbol)
+            else:
+                logger.warning("Insufficient data for %s - skipping", symbol)
+        
+        # Latest VWAP/RSI for every usable symbol in one batched kernel call; only
+        # the last values are needed, so no per-symbol indicator frames are built
+        try:
+            latest = calculate_latest_signals_batch([bars_by_symbol[symbol] for symbol in ready],
+                                                    RSI_PERIOD)
+        except Exception as e:
+            logger.error(f"Error calculating indicators: {e}")
+            return
+        
+        # Write all trade logs of this run in one batch after the loop; no write
+        # lock is held while orders go out over the network
+        with self.database.buffer_trades():
+            for symbol, signals in zip(ready, latest):
+                try:
+                    self.act_on_signals(symbol, signals)
+                except Exception as e:
+                    logger.error(f"Error analyzing {symbol}: {e}")
+                    continue
         
         logger.info("Strategy analysis complete")
     
-    def analyze_symbol(self, symbol: str):
+    def analyze_symbol(self, symbol: str, df=None):
         """
         Analyze a single symbol for VWAP Reversion signals.
         
         Args:
             symbol (str): Stock symbol to analyze
+            df (pd.DataFrame): Prefetched historical data (fetched here if None)
         """
         try:
             # Get historical data
-            df = self.trader.get_historical_data(symbol, Config.TIMEFRAME)
+            if df is None:
+                df = self.trader.get_historical_data(symbol, TIMEFRAME)
             
             if not validate_data_quality(df, min_bars=5):
-                logger.warning(f"Insufficient data for {symbol} - skipping")
+                logger.warning("Insufficient data for %s - skipping", symbol)
                 return
             
-            # Calculate indicators
-            df = calculate_all_indicators(df, Config.RSI_PERIOD)
-            
-            # Get latest signals
-            signals = get_latest_signals(df)
+            # Latest indicator values (same kernel run_strategy batches)
+            self.act_on_signals(symbol, calculate_latest_signals_batch([df], RSI_PERIOD)[0])
+        
+        except Exception as e:
+            logger.error(f"Error analyzing {symbol}: {e}")
+    
+    def act_on_signals(self, symbol: str, signals: Dict[str, Any]):
+        """
+        Check the buy/sell conditions on a symbol's latest indicator values and trade.
+        
+        Args:
+            symbol (str): Stock symbol
+            signals (dict): Latest indicator values (see indicators.get_latest_signals)
+        """
+        try:
             if not signals:
-                logger.warning(f"No signals available for {symbol}")
+                logger.warning("No signals available for %s", symbol)
                 return
             
             # Check for buy signal
@@ -125,7 +172,7 @@ class VWAPReversionBot:
                 self.execute_sell_order(symbol, signals)
             
             else:
-                logger.info(f"{symbol} → HOLD (no signal)")
+                logger.info("%s → HOLD (no signal)", symbol)
                 self.log_signal(symbol, "HOLD", signals)
         
         except Exception as e:
@@ -157,8 +204,8 @@ class VWAPReversionBot:
             )
             
             if order:
-                logger.info(f"{symbol} → BUY triggered @ ${current_price:.2f} (Qty: {qty:.2f})")
-                logger.info(f"  VWAP: ${vwap:.2f}, RSI: {rsi:.1f}")
+                logger.info("%s → BUY triggered @ $%.2f (Qty: %.2f)", symbol, current_price, qty)
+                logger.info("  VWAP: $%.2f, RSI: %.1f", vwap, rsi)
                 
                 # Log to database
                 self.database.log_trade(
@@ -194,7 +241,7 @@ class VWAPReversionBot:
             # Get current position
             position = self.trader.get_position(symbol)
             if not position or position.qty <= 0:
-                logger.info(f"{symbol} → No position to sell")
+                logger.info("%s → No position to sell", symbol)
                 return
             
             # Submit sell order
@@ -205,8 +252,8 @@ class VWAPReversionBot:
             )
             
             if order:
-                logger.info(f"{symbol} → SELL triggered @ ${current_price:.2f} (Qty: {position.qty:.2f})")
-                logger.info(f"  VWAP: ${vwap:.2f}, RSI: {rsi:.1f}")
+                logger.info("%s → SELL triggered @ $%.2f (Qty: %.2f)", symbol, current_price, position.qty)
+                logger.info("  VWAP: $%.2f, RSI: %.1f", vwap, rsi)
                 
                 # Log to database
                 self.database.log_trade(
@@ -235,17 +282,29 @@ class VWAPReversionBot:
             action (str): Signal action (BUY/SELL/HOLD)
             signals (dict): Latest indicator values
         """
+        # Skip the lookups, ratio and formatting entirely when INFO is filtered out
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         try:
-            logger.info(f"  Signal Details for {symbol}:")
-            logger.info(f"    Action: {action}")
-            logger.info(f"    Price: ${signals['close']:.2f}")
-            logger.info(f"    VWAP: ${signals['vwap']:.2f}" if signals['vwap'] else "    VWAP: N/A")
-            logger.info(f"    RSI: {signals['rsi']:.1f}" if signals['rsi'] else "    RSI: N/A")
+            close = signals['close']
+            vwap = signals['vwap']
+            rsi = signals['rsi']
+            logger.info("  Signal Details for %s:", symbol)
+            logger.info("    Action: %s", action)
+            logger.info("    Price: $%.2f", close)
+            if vwap:
+                logger.info("    VWAP: $%.2f", vwap)
+            else:
+                logger.info("    VWAP: N/A")
+            if rsi:
+                logger.info("    RSI: %.1f", rsi)
+            else:
+                logger.info("    RSI: N/A")
             
             # Calculate VWAP ratios
-            if signals['vwap']:
-                vwap_ratio = signals['close'] / signals['vwap']
-                logger.info(f"    Price/VWAP: {vwap_ratio:.3f}")
+            if vwap:
+                logger.info("    Price/VWAP: %.3f", close / vwap)
         
         except Exception as e:
             logger.error(f"Error logging signal for {symbol}: {e}")
@@ -301,7 +360,9 @@ class VWAPReversionBot:
         try:
             while True:
                 schedule.run_pending()
-                time.sleep(60)  # Check every minute
+                # Sleep exactly until the next job is due instead of polling
+                idle = schedule.idle_seconds()
+                time.sleep(max(0.0, idle) if idle is not None else 60)
         except KeyboardInterrupt:
             logger.info("Bot stopped by user")
         except Exception as e: